@@ -26,6 +26,31 @@ except ImportError as e:
     print("Please ensure you're running from the MyManaBox directory")
     sys.exit(1)
 
+# Quiet time after the last keystroke before the search filter runs
+SEARCH_DELAY_MS = 200
+
+
+def _card_to_row(card: Card) -> tuple:
+    """Format a card as the values of one card table row."""
+    # Calculate total value
+    market_val = float(card.market_value) if card.market_value else 0.0
+    total_val = market_val * card.count if market_val else 0.0
+    
+    return (
+        str(card.count),
+        card.name,
+        card.set_name or card.edition,
+        card.condition.value if card.condition else "",
+        "EN",  # Default language
+        "Yes" if card.foil else "",
+        card.rarity.value if card.rarity else "",
+        card.type_line or "",
+        str(card.cmc) if card.cmc else "",
+        "|".join(c.value for c in card.colors) if card.colors else "",
+        f"${market_val:.2f}" if market_val else "",
+        f"${total_val:.2f}" if total_val else ""
+    )
+
 
 class CardTableWidget:
     """Advanced table widget for displaying card collection data."""
@@ -80,107 +105,133 @@ class CardTableWidget:
         # Store sort direction
         self.sort_reverse = {}
         
-        # Store current data
-        self.current_data = []
+        # Store current data: the populated cards, their formatted rows and the indices shown
+        self.cards: List[Card] = []
+        self._rows: List[tuple] = []
+        self._search_text: List[str] = []
+        self._rarity: List[str] = []
+        self._set_text: List[str] = []
+        self._foil: List[bool] = []
+        self.set_names: List[str] = []
+        self._iids: List[str] = []
+        self._sort_key_cache: Dict[str, list] = {}
+        self.current_data: List[int] = []
     
     def sort_column(self, col):
         """Sort treeview by column."""
         reverse = self.sort_reverse.get(col, False)
         self.sort_reverse[col] = not reverse
         
-        # Get all items and sort
-        items = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
-        
-        # Convert to appropriate type for sorting
-        try:
-            # Try numeric sort first
-            items = [(float(str(val).replace('$', '').replace(',', '') if val else 0), child) for val, child in items]
-        except ValueError:
-            # Fall back to string sort
-            items = [(str(val).lower(), child) for val, child in items]
-        
-        items.sort(reverse=reverse)
-        
-        # Rearrange items in tree
-        for index, (val, child) in enumerate(items):
-            self.tree.move(child, '', index)
+        # Sort the rows currently shown by their cached keys and reorder them in one call
+        keys = self._sort_keys(col)
+        items = sorted(self.tree.get_children(''), key=lambda child: keys[int(child)], reverse=reverse)
+        self.tree.set_children('', *items)
+    
+    def _sort_keys(self, col) -> list:
+        """Sort key for every populated row in col, parsed once per populate."""
+        keys = self._sort_key_cache.get(col)
+        if keys is None:
+            column = self.columns.index(col)
+            values = [row[column] for row in self._rows]
+            try:
+                # Try numeric sort first
+                keys = [float(val.replace('$', '').replace(',', '')) if val else 0 for val in values]
+            except ValueError:
+                # Fall back to string sort
+                keys = [val.lower() for val in values]
+            self._sort_key_cache[col] = keys
+        return keys
     
     def _on_selection(self, event):
         """Handle selection change."""
         if self.on_selection_change:
             selected_items = self.tree.selection()
             if selected_items:
-                item = selected_items[0]
-                values = self.tree.item(item, 'values')
-                self.on_selection_change(values)
+                # Item ids are card indices, so no row values need to be read back from Tk
+                self.on_selection_change(int(selected_items[0]))
     
     def populate_data(self, cards: List[Card]):
         """Populate the table with card data."""
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        self.current_data = cards
-
-        # Add card data
-        for card in cards:
-            # Calculate total value
-            market_val = float(card.market_value) if card.market_value else 0.0
-            total_val = market_val * card.count if market_val else 0.0
-            
-            values = [
-                str(card.count),
-                card.name,
-                card.set_name or card.edition,
-                card.condition.value if card.condition else "",
-                "EN",  # Default language
-                "Yes" if card.foil else "",
-                card.rarity.value if card.rarity else "",
-                card.type_line or "",
-                str(card.cmc) if card.cmc else "",
-                "|".join(c.value for c in card.colors) if card.colors else "",
-                f"${market_val:.2f}" if market_val else "",
-                f"${total_val:.2f}" if total_val else ""
-            ]
-            self.tree.insert('', 'end', values=values)
+        self.cards = cards
+        # Rows are formatted once here and reused by every filter and search
+        self._rows = [_card_to_row(card) for card in cards]
+        # Filter columns, one entry per card, so filters never walk Card attributes
+        # Lowercased once so a search is a single substring test per card
+        self._search_text = [
+            f"{card.name}\0{card.edition}\0{card.type_line or ''}".lower() for card in cards
+        ]
+        self._rarity = [card.rarity.value.lower() if card.rarity else "" for card in cards]
+        self._set_text = [f"{card.set_name or ''}\0{card.edition or ''}" for card in cards]
+        self._foil = [card.foil for card in cards]
+        # Distinct values of the Set column, for the set filter
+        self.set_names = sorted({row[2] for row in self._rows if row[2]})
+        self.current_data = list(range(len(cards)))
+        self._sort_key_cache = {}
+        
+        # Hide the tree while rows change so Tk lays it out once, not once per insert
+        self.tree.grid_remove()
+        try:
+            # Rows hidden by a filter are detached, not deleted, so remove every item inserted last time
+            self.tree.delete(*self._iids)
+            # Each card keeps its index as item id, so filters can re-show rows without inserting them again
+            self._iids = [str(i) for i in range(len(cards))]
+            for iid, row in zip(self._iids, self._rows):
+                self.tree.insert('', 'end', iid=iid, values=row)
+        finally:
+            self.tree.grid()
+    
+    def show_rows(self, indices):
+        """Show the cards at the given indices of the populated card list."""
+        self.current_data = list(indices)
+        self._replace_rows(self.current_data)
+    
+    def _replace_rows(self, indices: List[int]):
+        """Show exactly the rows at indices, in that order."""
+        # One Tcl call re-attaches these items and detaches every other one
+        iids = self._iids
+        self.tree.set_children('', *[iids[i] for i in indices])
     
     def filter_data(self, search_term: str):
         """Filter the displayed data based on search term."""
         if not search_term:
-            self.populate_data(self.current_data)
+            self._replace_rows(self.current_data)
             return
         
-        filtered_cards = [
-            card for card in self.current_data
-            if search_term.lower() in card.name.lower() or
-               search_term.lower() in card.edition.lower() or
-               (card.type_line and search_term.lower() in card.type_line.lower())
-        ]
-        
         # Clear and repopulate with filtered data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._replace_rows(self.matching_rows(search_term, self.current_data))
+    
+    def filter_rows(self, rarity: str = "", set_filter: str = "", foil_only: bool = False,
+                    search_term: str = "") -> List[int]:
+        """Return the indices of the populated cards that pass every given filter."""
+        filtered_rows = range(len(self.cards))
         
-        for card in filtered_cards:
-            # Calculate total value
-            market_val = float(card.market_value) if card.market_value else 0.0
-            total_val = market_val * card.count if market_val else 0.0
-            
-            values = [
-                str(card.count),
-                card.name,
-                card.set_name or card.edition,
-                card.condition.value if card.condition else "",
-                "EN",
-                "Yes" if card.foil else "",
-                card.rarity.value if card.rarity else "",
-                card.type_line or "",
-                str(card.cmc) if card.cmc else "",
-                "|".join(c.value for c in card.colors) if card.colors else "",
-                f"${market_val:.2f}" if market_val else "",
-                f"${total_val:.2f}" if total_val else ""
-            ]
-            self.tree.insert('', 'end', values=values)
+        # Apply rarity filter
+        if rarity:
+            rarity = rarity.lower()
+            rarity_column = self._rarity
+            filtered_rows = [i for i in filtered_rows if rarity_column[i] == rarity]
+        
+        # Apply set filter
+        if set_filter:
+            set_column = self._set_text
+            filtered_rows = [i for i in filtered_rows if set_filter in set_column[i]]
+        
+        # Apply foil filter
+        if foil_only:
+            foil_column = self._foil
+            filtered_rows = [i for i in filtered_rows if foil_column[i]]
+        
+        # Apply search filter if active
+        if search_term:
+            filtered_rows = self.matching_rows(search_term, filtered_rows)
+        
+        return list(filtered_rows)
+    
+    def matching_rows(self, search_term: str, indices) -> List[int]:
+        """Return the indices whose card name, edition or type line contains search_term."""
+        term = search_term.lower()
+        search_text = self._search_text
+        return [i for i in indices if term in search_text[i]]
 
 
 class CardDetailPanel:
@@ -240,63 +291,42 @@ class CardDetailPanel:
         
         detail_content.grid_columnconfigure(1, weight=1)
     
-    def update_details(self, card_values):
-        """Update the detail panel with selected card information."""
-        if not card_values or len(card_values) < 2:
+    def update_details(self, card_index: int):
+        """Update the detail panel with the card at card_index in the card table."""
+        # The index refers to the list the table was populated from, which can
+        # lag behind current_collection until the table is repopulated
+        cards = self.main_gui.card_table.cards if self.main_gui else []
+        if not 0 <= card_index < len(cards):
             self.clear_details()
             return
-
-        # Find the actual card object from the current data
-        card_name = card_values[1] if len(card_values) > 1 else ""
-        
-        # Try to find the card in the current collection for full details
-        found_card = None
-        if self.main_gui and self.main_gui.current_collection:
-            for card in self.main_gui.current_collection.cards:
-                if card.name == card_name:
-                    found_card = card
-                    break
-        
-        if found_card:
-            # Use full card data
-            self.detail_vars["name"].set(found_card.name)
-            self.detail_vars["set"].set(found_card.set_name or found_card.edition)
-            self.detail_vars["rarity"].set(found_card.rarity.value if found_card.rarity else "")
-            self.detail_vars["type"].set(found_card.type_line or "")
-            self.detail_vars["mana_cost"].set(found_card.mana_cost or "")
-            self.detail_vars["cmc"].set(str(found_card.cmc) if found_card.cmc else "")
-            
-            # Power/Toughness or Loyalty
-            pt_text = ""
-            if found_card.power and found_card.toughness:
-                pt_text = f"{found_card.power}/{found_card.toughness}"
-            elif found_card.loyalty:
-                pt_text = f"Loyalty: {found_card.loyalty}"
-            self.detail_vars["pt"].set(pt_text)
-            
-            self.detail_vars["price"].set(f"${found_card.market_value:.2f}" if found_card.market_value else "")
-            self.detail_vars["purchase_price"].set(f"${found_card.purchase_price:.2f}" if found_card.purchase_price else "")
-            
-            # Oracle text
-            self.oracle_text_widget.delete(1.0, tk.END)
-            if found_card.oracle_text:
-                self.oracle_text_widget.insert(1.0, found_card.oracle_text)
-            else:
-                self.oracle_text_widget.insert(1.0, "No oracle text available")
+        
+        found_card = cards[card_index]
+        
+        # Use full card data
+        self.detail_vars["name"].set(found_card.name)
+        self.detail_vars["set"].set(found_card.set_name or found_card.edition)
+        self.detail_vars["rarity"].set(found_card.rarity.value if found_card.rarity else "")
+        self.detail_vars["type"].set(found_card.type_line or "")
+        self.detail_vars["mana_cost"].set(found_card.mana_cost or "")
+        self.detail_vars["cmc"].set(str(found_card.cmc) if found_card.cmc else "")
+        
+        # Power/Toughness or Loyalty
+        pt_text = ""
+        if found_card.power and found_card.toughness:
+            pt_text = f"{found_card.power}/{found_card.toughness}"
+        elif found_card.loyalty:
+            pt_text = f"Loyalty: {found_card.loyalty}"
+        self.detail_vars["pt"].set(pt_text)
+        
+        self.detail_vars["price"].set(f"${found_card.market_value:.2f}" if found_card.market_value else "")
+        self.detail_vars["purchase_price"].set(f"${found_card.purchase_price:.2f}" if found_card.purchase_price else "")
+        
+        # Oracle text
+        self.oracle_text_widget.delete(1.0, tk.END)
+        if found_card.oracle_text:
+            self.oracle_text_widget.insert(1.0, found_card.oracle_text)
         else:
-            # Fall back to table values
-            self.detail_vars["name"].set(card_values[1] if len(card_values) > 1 else "")
-            self.detail_vars["set"].set(card_values[2] if len(card_values) > 2 else "")
-            self.detail_vars["rarity"].set(card_values[6] if len(card_values) > 6 else "")
-            self.detail_vars["type"].set(card_values[7] if len(card_values) > 7 else "")
-            self.detail_vars["mana_cost"].set("")
-            self.detail_vars["cmc"].set(card_values[8] if len(card_values) > 8 else "")
-            self.detail_vars["pt"].set("")
-            self.detail_vars["price"].set(card_values[10] if len(card_values) > 10 else "")
-            self.detail_vars["purchase_price"].set("")
-            
-            self.oracle_text_widget.delete(1.0, tk.END)
-            self.oracle_text_widget.insert(1.0, "Card details not available")
+            self.oracle_text_widget.insert(1.0, "No oracle text available")
     
     def clear_details(self):
         """Clear all detail fields."""
@@ -372,6 +402,7 @@ class MyManaBoxGUI:
         self.collection_service = None
         self.search_service = None
         self.current_collection = None
+        self._search_after_id = None
         
         # Setup GUI
         self.setup_styles()
@@ -607,11 +638,7 @@ class MyManaBoxGUI:
                     self.stats_panel.update_stats(self.current_collection)
                     
                     # Update set filter options
-                    sets = sorted(set(card.set_name or card.edition for card in self.current_collection.cards 
-                                    if card.set_name or card.edition))
-                    # Update set combobox values
-                    if hasattr(self, 'set_combo'):
-                        self.set_combo['values'] = ["All"] + sets
+                    self.update_set_options()
                     
                     self.status_var.set(f"Loaded {self.current_collection.total_cards} cards "
                                       f"({self.current_collection.unique_cards} unique)")
@@ -626,7 +653,15 @@ class MyManaBoxGUI:
             self.status_var.set("Error loading collection")
     
     def on_search_change(self, *args):
-        """Handle search text change."""
+        """Handle search text change once typing pauses."""
+        # Each keystroke restarts the delay, so a typed word filters the table once
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DELAY_MS, self._do_search)
+    
+    def _do_search(self):
+        """Filter the card table by the current search text."""
+        self._search_after_id = None
         if hasattr(self, 'card_table'):
             search_term = self.search_var.get()
             self.card_table.filter_data(search_term)
@@ -635,55 +670,42 @@ class MyManaBoxGUI:
         """Clear search field."""
         self.search_var.set("")
     
-    def on_card_selection(self, card_values):
+    def on_card_selection(self, card_index):
         """Handle card selection in table."""
-        self.detail_panel.update_details(card_values)
+        self.detail_panel.update_details(card_index)
     
     def apply_filters(self):
         """Apply selected filters to the collection view."""
         if not self.current_collection:
             return
         
-        filtered_cards = self.current_collection.cards
-        
-        # Apply rarity filter
         rarity_filter = self.rarity_var.get()
-        if rarity_filter and rarity_filter != "All":
-            filtered_cards = [card for card in filtered_cards 
-                             if card.rarity and card.rarity.value.lower() == rarity_filter.lower()]
-        
-        # Apply set filter
         set_filter = self.set_var.get()
-        if set_filter and set_filter != "All":
-            filtered_cards = [card for card in filtered_cards 
-                             if (card.set_name and set_filter in card.set_name) or 
-                                (card.edition and set_filter in card.edition)]
-        
-        # Apply foil filter
-        if self.foil_var.get():
-            filtered_cards = [card for card in filtered_cards if card.foil]
-        
-        # Apply search filter if active
-        search_term = self.search_var.get()
-        if search_term:
-            filtered_cards = [
-                card for card in filtered_cards
-                if search_term.lower() in card.name.lower() or
-                   (card.edition and search_term.lower() in card.edition.lower()) or
-                   (card.type_line and search_term.lower() in card.type_line.lower())
-            ]
+        filtered_rows = self.card_table.filter_rows(
+            rarity=rarity_filter if rarity_filter != "All" else "",
+            set_filter=set_filter if set_filter != "All" else "",
+            foil_only=self.foil_var.get(),
+            search_term=self.search_var.get(),
+        )
         
         # Update table
-        self.card_table.populate_data(filtered_cards)
-        self.status_var.set(f"Showing {len(filtered_cards)} cards")
+        self.card_table.show_rows(filtered_rows)
+        self.status_var.set(f"Showing {len(filtered_rows)} cards")
     
     def refresh_collection(self):
         """Refresh the collection display."""
         if self.current_collection:
             self.card_table.populate_data(self.current_collection.cards)
             self.stats_panel.update_stats(self.current_collection)
+            # Enrichment can fill in set names
+            self.update_set_options()
             self.status_var.set("Collection refreshed")
     
+    def update_set_options(self):
+        """Offer the table's distinct sets in the set filter."""
+        if hasattr(self, 'set_combo'):
+            self.set_combo['values'] = ["All"] + self.card_table.set_names
+    
     # Menu command methods
     def open_collection(self):
         """Open collection file dialog."""
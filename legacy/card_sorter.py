@@ -4,34 +4,183 @@ MyManaBox - Magic: The Gathering Card Sorting Program
 A comprehensive tool for organizing and managing MTG card collections.
 """
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from collections import defaultdict
 import argparse
 from colorama import init, Fore, Style
 from tabulate import tabulate
 import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Initialize colorama for Windows compatibility
 init()
 
+# Prefer pyarrow's multithreaded CSV reader and Arrow string kernels when installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+NAME_DTYPE = 'string[pyarrow]' if HAS_PYARROW else 'string'
+
+# Explicit dtypes for Moxfield exports; repeated short strings become categoricals
+CSV_DTYPES = {
+    'Count': 'int32',
+    'Name': NAME_DTYPE,
+    'Edition': 'category',
+    'Condition': 'category',
+    'Foil': 'category',
+}
+
+# Parquet metadata key holding the [mtime_ns, size] of the CSV a snapshot was taken from
+SNAPSHOT_SOURCE_KEY = b'mymanabox.source'
+
+# Moxfield's 'Last Modified' format; the pyarrow reader parses it into timestamps
+CSV_DATE_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# Name keywords for the heuristic sorters, in priority order (first match wins)
+COLOR_KEYWORDS = {
+    'Black': ('swamp', 'black', 'dark', 'death', 'shadow'),
+    'Blue': ('island', 'blue', 'water', 'counter', 'draw'),
+    'White': ('plains', 'white', 'angel', 'heal', 'life'),
+    'Red': ('mountain', 'red', 'fire', 'lightning', 'burn'),
+    'Green': ('forest', 'green', 'elf', 'growth', 'nature'),
+    'Colorless': ('artifact', 'colorless'),
+}
+TYPE_KEYWORDS = {
+    'Lands': ('swamp', 'island', 'plains', 'mountain', 'forest', 'hub', 'wastes'),
+    'Creatures': ('angel', 'demon', 'dragon', 'elf', 'knight', 'beast', 'warrior'),
+    'Artifacts': ('aether', 'mana', 'mind', 'soul'),
+}
+
+# One compiled alternation per bucket, matched against lowercased names
+COLOR_PATTERNS = {color: re.compile('|'.join(words)) for color, words in COLOR_KEYWORDS.items()}
+TYPE_PATTERNS = {card_type: re.compile('|'.join(words)) for card_type, words in TYPE_KEYWORDS.items()}
+# Basic land names only count as whole words, so e.g. "Hubris" is not a land
+TYPE_PATTERNS['Lands'] = re.compile(r'\b(?:' + '|'.join(TYPE_KEYWORDS['Lands']) + r')\b')
+
+# Purchase-price tier boundaries (lower bound inclusive) for the rarity heuristic
+RARITY_LABELS = ['Common', 'Uncommon', 'Rare', 'Mythic Rare']
+RARITY_PRICE_BOUNDS = np.array([0.50, 2.00, 10.00])
+
+# Downloads are streamed to disk; only the first bytes are inspected for CSV headers
+HEADER_PROBE_BYTES = 4096
+DOWNLOAD_BUFFER_BYTES = 1024 * 1024
+
+# Console tables are capped so large results stay readable (--ascii-table shows all rows)
+TABLE_MAX_ROWS = 25
+TABLE_MAX_COLWIDTH = 40
+
+
+def write_csv(df: pd.DataFrame, filepath: Path, append: bool = False) -> None:
+    """Write a DataFrame to CSV in pandas' format, shared by every export path.
+    
+    pyarrow's writer is not used: it quotes every string, writes lowercase
+    booleans and nanosecond timestamps, so exports would change format
+    depending on which code path produced them. Parsed timestamps are written
+    back in Moxfield's format. With append, rows are added to an existing
+    file without repeating the header.
+    """
+    df.to_csv(filepath, mode='a' if append else 'w', header=not append, index=False,
+              date_format=CSV_DATE_FORMAT)
+
+
+def classify_names(names: pd.Series, patterns: Dict[str, re.Pattern], default: str) -> pd.Categorical:
+    """Label each lowercased name with the first bucket whose pattern it matches.
+    
+    A single pass with every keyword combined finds the names that match any
+    bucket; most names match none and go straight to the default. Only the
+    matching names are tested bucket by bucket, filling a boolean hit matrix
+    whose first true column per row (argmax) is the highest-priority bucket.
+    """
+    any_pattern = re.compile('|'.join(pattern.pattern for pattern in patterns.values()))
+    matched = names.str.contains(any_pattern, na=False).to_numpy(dtype=bool)
+    candidates = names[matched]
+    
+    hits = np.ones((len(candidates), len(patterns) + 1), dtype=bool)
+    for column, pattern in enumerate(patterns.values()):
+        hits[:, column] = candidates.str.contains(pattern, na=False).to_numpy(dtype=bool)
+    
+    codes = np.full(len(names), len(patterns))
+    codes[matched] = hits.argmax(axis=1)
+    return pd.Categorical.from_codes(codes, categories=[*patterns, default])
+
+
+def price_tiers(prices: pd.Series) -> pd.Categorical:
+    """Label each purchase price with its rarity tier from RARITY_LABELS."""
+    # Branchless binning: side='right' puts a price equal to a bound in the higher tier
+    codes = np.searchsorted(RARITY_PRICE_BOUNDS, prices.to_numpy(), side='right')
+    return pd.Categorical.from_codes(codes, categories=RARITY_LABELS)
+
+
 class MTGCardSorter:
     """Main class for handling Magic: The Gathering card sorting and organization."""
     
-    def __init__(self, csv_file: str = "moxfield_export.csv"):
-        """Initialize the card sorter with a CSV file."""
+    def __init__(self, csv_file: str = "moxfield_export.csv", chunksize: Optional[int] = None,
+                 ascii_table: bool = False):
+        """Initialize the card sorter with a CSV file.
+        
+        With chunksize set, the CSV is read chunksize rows at a time and sorted
+        exports are streamed chunk by chunk instead of loading the whole file.
+        ascii_table selects tabulate's grid output over pandas' plain tables.
+        """
         self.csv_file = csv_file
-        self.cards_df = None
-        self.load_cards()
+        self.chunksize = chunksize
+        self.ascii_table = ascii_table
+        self._session = self._create_session()
+        self._cards_df = None
+        self._loaded = False  # The CSV is parsed on first access to cards_df
+        self.prices = None  # Numeric 'Purchase Price', parsed once per load
+        self._name_lower = None  # Lowercased 'Name', shared by classifiers and search
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """HTTP session that reuses connections and retries transient failures."""
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    @property
+    def cards_df(self) -> Optional[pd.DataFrame]:
+        """The loaded collection, or None if the CSV could not be read."""
+        if not self._loaded:
+            self.load_cards()
+        return self._cards_df
         
     def load_cards(self):
         """Load cards from the CSV file."""
+        self._loaded = True  # A failed load is reported once, not retried on every access
+        self._cards_df = None
         try:
-            self.cards_df = pd.read_csv(self.csv_file)
-            print(f"{Fore.GREEN}✓ Loaded {len(self.cards_df)} cards from {self.csv_file}{Style.RESET_ALL}")
+            if self.chunksize:
+                # The pyarrow engine cannot chunk; categories are re-unified after the concat
+                chunks = pd.read_csv(self.csv_file, chunksize=self.chunksize, dtype=CSV_DTYPES)
+                cards_df = pd.concat(chunks, ignore_index=True).astype(CSV_DTYPES)
+            elif self._snapshot_is_fresh():
+                cards_df = pd.read_parquet(self.snapshot_file)
+            else:
+                # Stamped before parsing, so a CSV changed mid-read is not marked fresh
+                source_stamp = self._source_stamp()
+                cards_df = pd.read_csv(self.csv_file, engine=CSV_ENGINE, dtype=CSV_DTYPES)
+                self._write_snapshot(cards_df, source_stamp)
+            self.prices = self._parse_prices(cards_df['Purchase Price'])
+            self._name_lower = cards_df['Name'].str.lower()
+            self._cards_df = cards_df
+            print(f"{Fore.GREEN}✓ Loaded {len(cards_df)} cards from {self.csv_file}{Style.RESET_ALL}")
         except FileNotFoundError:
             print(f"{Fore.RED}✗ Error: Could not find {self.csv_file}{Style.RESET_ALL}")
             return
@@ -39,139 +188,188 @@ class MTGCardSorter:
             print(f"{Fore.RED}✗ Error loading CSV: {e}{Style.RESET_ALL}")
             return
     
+    @property
+    def snapshot_file(self) -> Path:
+        """Parquet copy of the parsed CSV, reused while the CSV is unchanged."""
+        return Path(self.csv_file).with_suffix('.parquet')
+    
+    def _source_stamp(self) -> bytes:
+        """The CSV's mtime and size, as recorded in the snapshot's metadata."""
+        stat = os.stat(self.csv_file)
+        return json.dumps([stat.st_mtime_ns, stat.st_size]).encode()
+    
+    def _snapshot_is_fresh(self) -> bool:
+        """True if a Parquet snapshot exists and was taken from the CSV as it is now.
+        
+        The stamps are compared for equality, not by age: a CSV replaced by an
+        older copy (cp -p, unzip, git checkout) must not reuse the snapshot.
+        """
+        if not HAS_PYARROW or not self.snapshot_file.exists():
+            return False
+        source_stamp = self._source_stamp()
+        try:
+            metadata = pq.read_schema(self.snapshot_file).metadata or {}
+        except Exception:
+            return False
+        return metadata.get(SNAPSHOT_SOURCE_KEY) == source_stamp
+    
+    def _write_snapshot(self, cards_df: pd.DataFrame, source_stamp: bytes):
+        """Save the parsed collection as Parquet so the next run can skip CSV parsing."""
+        if not HAS_PYARROW:
+            return
+        try:
+            table = pa.Table.from_pandas(cards_df, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), SNAPSHOT_SOURCE_KEY: source_stamp}
+            )
+            pq.write_table(table, self.snapshot_file, compression='zstd')
+        except Exception:
+            # The snapshot is only a cache; a read-only directory must not break loading
+            self._discard_snapshot()
+    
+    def _discard_snapshot(self):
+        """Remove the Parquet snapshot, e.g. after the CSV has been replaced."""
+        try:
+            self.snapshot_file.unlink()
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _parse_prices(purchase_prices: pd.Series) -> pd.Series:
+        """Convert '$1.23'-style purchase prices to floats, treating blanks as 0."""
+        if pd.api.types.is_numeric_dtype(purchase_prices):
+            # The CSV reader already parsed the column; skip the string round-trip
+            return purchase_prices.astype(np.float64).fillna(0.0)
+        return pd.to_numeric(
+            purchase_prices.astype(str).str.lstrip('$'),
+            errors='coerce'
+        ).fillna(0.0)
+    
+    def total_count(self) -> int:
+        """Total number of cards, accumulated in int64 over the int32 'Count' column."""
+        return int(self.cards_df['Count'].to_numpy().sum(dtype=np.int64))
+    
+    def _count_by(self, column: str, counts: np.ndarray) -> pd.Series:
+        """Total of counts per category of a categorical column (observed categories only).
+        
+        A single np.bincount pass over the category codes replaces a hashed groupby.
+        """
+        keys = self.cards_df[column].cat
+        codes = keys.codes.to_numpy()
+        present = codes >= 0  # -1 marks missing values, which groupby would drop
+        size = len(keys.categories)
+        rows = np.bincount(codes[present], minlength=size)
+        totals = np.bincount(
+            codes[present], weights=counts[present], minlength=size
+        ).astype(np.int64)
+        observed = rows > 0
+        return pd.Series(totals[observed], index=keys.categories[observed])
+    
     def display_summary(self):
         """Display a summary of the card collection."""
         if self.cards_df is None:
             return
             
-        total_cards = self.cards_df['Count'].sum()
+        total_cards = self.total_count()
         unique_cards = len(self.cards_df)
-        total_value = self.cards_df['Purchase Price'].replace('', 0).astype(str).str.replace('$', '').astype(float).sum()
+        prices = self.prices.to_numpy()
+        total_value = prices.sum()
         
         print(f"\n{Fore.CYAN}=== Collection Summary ==={Style.RESET_ALL}")
         print(f"Total Cards: {total_cards}")
         print(f"Unique Cards: {unique_cards}")
         print(f"Total Purchase Value: ${total_value:.2f}")
         
-        # Top 10 most valuable cards
-        df_with_prices = self.cards_df.copy()
-        df_with_prices['Price'] = df_with_prices['Purchase Price'].replace('', 0).astype(str).str.replace('$', '').astype(float)
-        top_valuable = df_with_prices.nlargest(10, 'Price')[['Name', 'Edition', 'Price', 'Count']]
-        
-        if not top_valuable.empty:
+        # Top 10 most valuable cards: O(n) partition, then sort only those rows
+        top_count = min(10, unique_cards)
+        if top_count:
+            top_idx = np.argpartition(prices, -top_count)[-top_count:]
+            top_idx = top_idx[np.argsort(-prices[top_idx], kind='stable')]
+            # Take just the needed rows and columns in one step; no full-frame copy
+            columns = self.cards_df.columns.get_indexer(['Name', 'Edition', 'Count'])
+            top_valuable = self.cards_df.iloc[top_idx, columns]
+            top_valuable.insert(2, 'Price', prices[top_idx])
+            
             print(f"\n{Fore.YELLOW}Top 10 Most Valuable Cards:{Style.RESET_ALL}")
-            print(tabulate(top_valuable.values, headers=['Name', 'Edition', 'Price', 'Count'], tablefmt='grid'))
+            self._print_table(top_valuable, ['Name', 'Edition', 'Price', 'Count'])
+    
+    def _print_table(self, table: pd.DataFrame, headers: List[str]):
+        """Print a result table, truncated to TABLE_MAX_ROWS unless ascii_table is set."""
+        if self.ascii_table:
+            # Plain row tuples skip tabulate's DataFrame/object-array introspection
+            rows = list(table.itertuples(index=False, name=None))
+            print(tabulate(rows, headers=headers, tablefmt='grid'))
+        else:
+            print(table.set_axis(headers, axis=1).to_string(
+                index=False, max_rows=TABLE_MAX_ROWS, max_colwidth=TABLE_MAX_COLWIDTH
+            ))
     
-    def sort_by_color(self) -> Dict[str, List]:
+    def sort_by_color(self) -> Dict[str, pd.DataFrame]:
         """Sort cards by color identity (requires API lookup for accurate color data)."""
         if self.cards_df is None:
             return {}
             
-        color_groups = {
-            'White': [],
-            'Blue': [],
-            'Black': [],
-            'Red': [],
-            'Green': [],
-            'Colorless': [],
-            'Multicolor': []
-        }
-        
         # For now, sort by basic color associations in card names
         # This is a simplified approach - a full implementation would use the Scryfall API
-        for _, card in self.cards_df.iterrows():
-            name = card['Name'].lower()
-            # Basic heuristic color sorting (this would be much better with API data)
-            if any(word in name for word in ['swamp', 'black', 'dark', 'death', 'shadow']):
-                color_groups['Black'].append(card)
-            elif any(word in name for word in ['island', 'blue', 'water', 'counter', 'draw']):
-                color_groups['Blue'].append(card)
-            elif any(word in name for word in ['plains', 'white', 'angel', 'heal', 'life']):
-                color_groups['White'].append(card)
-            elif any(word in name for word in ['mountain', 'red', 'fire', 'lightning', 'burn']):
-                color_groups['Red'].append(card)
-            elif any(word in name for word in ['forest', 'green', 'elf', 'growth', 'nature']):
-                color_groups['Green'].append(card)
-            elif any(word in name for word in ['artifact', 'colorless']):
-                color_groups['Colorless'].append(card)
-            else:
-                color_groups['Multicolor'].append(card)
+        # Basic heuristic color sorting (this would be much better with API data)
+        colors = classify_names(self._name_lower, COLOR_PATTERNS, 'Multicolor')
         
-        return color_groups
+        return self._split_groups(
+            colors, ['White', 'Blue', 'Black', 'Red', 'Green', 'Colorless', 'Multicolor']
+        )
     
-    def sort_by_set(self) -> Dict[str, List]:
+    def sort_by_set(self) -> Dict[str, pd.DataFrame]:
         """Sort cards by set/edition."""
         if self.cards_df is None:
             return {}
-            
-        set_groups = defaultdict(list)
-        for _, card in self.cards_df.iterrows():
-            set_groups[card['Edition']].append(card)
         
-        return dict(set_groups)
+        # Editions in order of first appearance; categorical codes make this cheap
+        return {
+            str(edition): cards
+            for edition, cards in self.cards_df.groupby('Edition', sort=False, observed=True)
+        }
     
-    def sort_by_rarity(self) -> Dict[str, List]:
+    def sort_by_rarity(self) -> Dict[str, pd.DataFrame]:
         """Sort cards by rarity (would need API data for accurate rarity)."""
         if self.cards_df is None:
             return {}
             
         # Placeholder - would need API integration for real rarity data
-        rarity_groups = {
-            'Common': [],
-            'Uncommon': [],
-            'Rare': [],
-            'Mythic Rare': []
-        }
-        
-        # Basic heuristic based on purchase price
-        for _, card in self.cards_df.iterrows():
-            price = float(str(card['Purchase Price']).replace('$', '') or 0)
-            if price == 0:
-                rarity_groups['Common'].append(card)
-            elif price < 0.50:
-                rarity_groups['Common'].append(card)
-            elif price < 2.00:
-                rarity_groups['Uncommon'].append(card)
-            elif price < 10.00:
-                rarity_groups['Rare'].append(card)
-            else:
-                rarity_groups['Mythic Rare'].append(card)
-        
-        return rarity_groups
+        # Basic heuristic based on purchase price (missing prices count as 0)
+        return self._split_groups(price_tiers(self.prices), RARITY_LABELS)
     
-    def sort_by_type(self) -> Dict[str, List]:
+    def sort_by_type(self) -> Dict[str, pd.DataFrame]:
         """Sort cards by type (heuristic based on card names)."""
         if self.cards_df is None:
             return {}
             
-        type_groups = {
-            'Creatures': [],
-            'Instants': [],
-            'Sorceries': [],
-            'Artifacts': [],
-            'Enchantments': [],
-            'Planeswalkers': [],
-            'Lands': [],
-            'Other': []
-        }
-        
         # Basic heuristic type sorting based on common naming patterns
-        for _, card in self.cards_df.iterrows():
-            name = card['Name'].lower()
-            
-            if any(word in name for word in ['swamp', 'island', 'plains', 'mountain', 'forest', 'hub', 'wastes']):
-                type_groups['Lands'].append(card)
-            elif any(word in name for word in ['angel', 'demon', 'dragon', 'elf', 'knight', 'beast', 'warrior']):
-                type_groups['Creatures'].append(card)
-            elif any(word in name for word in ['aether', 'mana', 'mind', 'soul']):
-                type_groups['Artifacts'].append(card)
-            else:
-                type_groups['Other'].append(card)
+        types = classify_names(self._name_lower, TYPE_PATTERNS, 'Other')
+        
+        return self._split_groups(
+            types,
+            ['Creatures', 'Instants', 'Sorceries', 'Artifacts',
+             'Enchantments', 'Planeswalkers', 'Lands', 'Other']
+        )
+    
+    def _split_groups(self, keys: pd.Categorical, group_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """Split the collection into one DataFrame per group label.
         
-        return type_groups
+        Every name in group_names is present in the result (empty groups get an
+        empty frame) so callers see the same keys regardless of the data.
+        """
+        # Group on the categorical codes directly instead of per-row label strings
+        grouped = dict(tuple(self.cards_df.groupby(keys, sort=False, observed=True)))
+        empty = self.cards_df.iloc[0:0]
+        return {name: grouped.get(name, empty) for name in group_names}
     
     def export_sorted_collection(self, sort_type: str, output_dir: str = "sorted_output"):
         """Export sorted collection to CSV files."""
+        if self.chunksize and not self._loaded:
+            # Nothing is in memory yet, so stream instead of loading the whole file
+            self._export_sorted_chunks(sort_type, output_dir)
+            return
+        
         if self.cards_df is None:
             return
             
@@ -190,31 +388,84 @@ class MTGCardSorter:
             print(f"{Fore.RED}✗ Unknown sort type: {sort_type}{Style.RESET_ALL}")
             return
         
-        for group_name, cards in groups.items():
-            if cards:  # Only create files for non-empty groups
-                df = pd.DataFrame(cards)
-                filename = f"{sort_type}_{group_name.replace(' ', '_').lower()}.csv"
-                filepath = output_path / filename
-                df.to_csv(filepath, index=False)
+        # Only create files for non-empty groups
+        jobs = [
+            (output_path / f"{sort_type}_{group_name.replace(' ', '_').lower()}.csv", cards)
+            for group_name, cards in groups.items()
+            if not cards.empty
+        ]
+        if not jobs:
+            return
+        
+        # Group files are independent, so write them concurrently and report in order
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(write_csv, cards, filepath) for filepath, cards in jobs]
+            for (filepath, cards), future in zip(jobs, futures):
+                future.result()
                 print(f"{Fore.GREEN}✓ Exported {len(cards)} cards to {filepath}{Style.RESET_ALL}")
     
+    def _export_sorted_chunks(self, sort_type: str, output_dir: str):
+        """Export sorted groups by streaming the CSV, appending each chunk to its group files.
+        
+        Peak memory is bounded by chunksize rather than by the size of the collection.
+        """
+        if sort_type not in ("color", "set", "rarity", "type"):
+            print(f"{Fore.RED}✗ Unknown sort type: {sort_type}{Style.RESET_ALL}")
+            return
+        
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
+        
+        written: Dict[Path, int] = {}
+        try:
+            for chunk in pd.read_csv(self.csv_file, chunksize=self.chunksize, dtype=CSV_DTYPES):
+                keys = self._group_keys(sort_type, chunk)
+                for group_name, cards in chunk.groupby(keys, sort=False, observed=True):
+                    filepath = output_path / f"{sort_type}_{str(group_name).replace(' ', '_').lower()}.csv"
+                    # The first chunk for a file truncates it and writes the header
+                    write_csv(cards, filepath, append=filepath in written)
+                    written[filepath] = written.get(filepath, 0) + len(cards)
+        except FileNotFoundError:
+            print(f"{Fore.RED}✗ Error: Could not find {self.csv_file}{Style.RESET_ALL}")
+            return
+        
+        for filepath, count in written.items():
+            print(f"{Fore.GREEN}✓ Exported {count} cards to {filepath}{Style.RESET_ALL}")
+    
+    def _group_keys(self, sort_type: str, cards: pd.DataFrame) -> pd.Categorical:
+        """Group label for every row of a chunk, using the same rules as the sort_by_* methods."""
+        if sort_type == "color":
+            return classify_names(cards['Name'].str.lower(), COLOR_PATTERNS, 'Multicolor')
+        if sort_type == "rarity":
+            return price_tiers(self._parse_prices(cards['Purchase Price']))
+        if sort_type == "type":
+            return classify_names(cards['Name'].str.lower(), TYPE_PATTERNS, 'Other')
+        return cards['Edition'].array
+    
     def find_duplicates(self):
         """Find duplicate cards in the collection."""
         if self.cards_df is None:
             return
             
-        # Group by name and edition to find duplicates
-        duplicates = self.cards_df.groupby(['Name', 'Edition']).agg({
-            'Count': 'sum',
-            'Purchase Price': 'first'
-        }).reset_index()
-        
-        # Filter for cards with count > 1
-        real_duplicates = duplicates[duplicates['Count'] > 1]
+        # Only rows that repeat a (name, edition) pair or hold several copies
+        # can add up to more than one card, so aggregate just those
+        candidates = (
+            self.cards_df.duplicated(['Name', 'Edition'], keep=False)
+            | (self.cards_df['Count'] > 1)
+        )
+        real_duplicates = self.cards_df.iloc[0:0]
+        if candidates.any():
+            # Named aggregation with as_index=False yields the flat frame without reset_index
+            duplicates = self.cards_df[candidates].groupby(
+                ['Name', 'Edition'], observed=True, as_index=False
+            ).agg(Count=('Count', 'sum'), Price=('Purchase Price', 'first'))
+            
+            # Filter for cards with count > 1
+            real_duplicates = duplicates[duplicates['Count'] > 1]
         
         if not real_duplicates.empty:
             print(f"\n{Fore.YELLOW}=== Duplicate Cards ==={Style.RESET_ALL}")
-            print(tabulate(real_duplicates.values, headers=['Name', 'Edition', 'Total Count', 'Price'], tablefmt='grid'))
+            self._print_table(real_duplicates, ['Name', 'Edition', 'Total Count', 'Price'])
         else:
             print(f"\n{Fore.GREEN}✓ No duplicate cards found!{Style.RESET_ALL}")
     
@@ -223,12 +474,15 @@ class MTGCardSorter:
         if self.cards_df is None:
             return
             
-        results = self.cards_df[self.cards_df['Name'].str.contains(query, case=False, na=False)]
+        # Plain substring match; on Arrow-backed names this runs match_substring
+        results = self.cards_df[
+            self._name_lower.str.contains(query.lower(), regex=False, na=False)
+        ]
         
         if not results.empty:
             print(f"\n{Fore.CYAN}=== Search Results for '{query}' ==={Style.RESET_ALL}")
             display_cols = ['Name', 'Edition', 'Count', 'Purchase Price', 'Condition']
-            print(tabulate(results[display_cols].values, headers=display_cols, tablefmt='grid'))
+            self._print_table(results[display_cols], display_cols)
         else:
             print(f"\n{Fore.YELLOW}No cards found matching '{query}'{Style.RESET_ALL}")
     
@@ -239,21 +493,26 @@ class MTGCardSorter:
             
         print(f"\n{Fore.CYAN}=== Detailed Collection Statistics ==={Style.RESET_ALL}")
         
+        # Both breakdowns reduce the same Count array, fetched once
+        counts = self.cards_df['Count'].to_numpy()
+        
         # Cards by condition
-        condition_stats = self.cards_df.groupby('Condition')['Count'].sum().sort_values(ascending=False)
+        condition_stats = self._count_by('Condition', counts).sort_values(ascending=False)
         print(f"\n{Fore.YELLOW}Cards by Condition:{Style.RESET_ALL}")
         for condition, count in condition_stats.items():
             print(f"  {condition}: {count}")
         
         # Cards by set (top 10)
-        set_stats = self.cards_df.groupby('Edition')['Count'].sum().sort_values(ascending=False).head(10)
+        set_stats = self._count_by('Edition', counts).nlargest(10)
         print(f"\n{Fore.YELLOW}Top 10 Sets by Card Count:{Style.RESET_ALL}")
         for edition, count in set_stats.items():
             print(f"  {edition}: {count}")
         
         # Foil vs non-foil
-        foil_count = len(self.cards_df[self.cards_df['Foil'] != ''])
-        non_foil_count = len(self.cards_df[self.cards_df['Foil'] == ''])
+        # One boolean pass; blank Foil cells are read as missing, so they count as non-foil
+        foil = self.cards_df['Foil']
+        foil_count = int((foil.notna() & foil.ne('')).sum())
+        non_foil_count = len(foil) - foil_count
         print(f"\n{Fore.YELLOW}Foil Status:{Style.RESET_ALL}")
         print(f"  Foil cards: {foil_count}")
         print(f"  Non-foil cards: {non_foil_count}")
@@ -298,27 +557,36 @@ class MTGCardSorter:
             for endpoint in endpoints_to_try:
                 try:
                     print(f"{Fore.YELLOW}Trying: {endpoint}{Style.RESET_ALL}")
-                    response = requests.get(endpoint, headers=headers, timeout=30)
-                    
-                    if response.status_code == 200:
-                        # Check if we got CSV content
-                        content = response.text
-                        if content and ('Count' in content or 'Name' in content):
-                            # Save the CSV content
-                            with open(self.csv_file, 'w', encoding='utf-8') as f:
-                                f.write(content)
-                            
-                            print(f"{Fore.GREEN}✓ Collection data downloaded successfully{Style.RESET_ALL}")
-                            success = True
-                            break
+                    with self._session.get(endpoint, headers=headers, timeout=30, stream=True) as response:
+                        if response.status_code == 200:
+                            # Stream the body straight to disk; only one chunk is held in memory
+                            chunks = response.iter_content(DOWNLOAD_BUFFER_BYTES)
+                            head = next(chunks, b'')
+                            probe = head[:HEADER_PROBE_BYTES]
+                            if b'Count' in probe or b'Name' in probe:
+                                partial_file = f"{self.csv_file}.part"
+                                try:
+                                    with open(partial_file, 'wb') as f:
+                                        f.write(head)
+                                        for chunk in chunks:
+                                            f.write(chunk)
+                                    os.replace(partial_file, self.csv_file)
+                                finally:
+                                    # Interrupted downloads must not leave a stray .part file
+                                    if os.path.exists(partial_file):
+                                        os.remove(partial_file)
+                                
+                                print(f"{Fore.GREEN}✓ Collection data downloaded successfully{Style.RESET_ALL}")
+                                success = True
+                                break
+                            else:
+                                print(f"{Fore.YELLOW}⚠ Response doesn't contain expected CSV data{Style.RESET_ALL}")
+                        elif response.status_code == 403:
+                            print(f"{Fore.YELLOW}⚠ Access forbidden - collection may be private{Style.RESET_ALL}")
+                        elif response.status_code == 404:
+                            print(f"{Fore.YELLOW}⚠ Collection not found{Style.RESET_ALL}")
                         else:
-                            print(f"{Fore.YELLOW}⚠ Response doesn't contain expected CSV data{Style.RESET_ALL}")
-                    elif response.status_code == 403:
-                        print(f"{Fore.YELLOW}⚠ Access forbidden - collection may be private{Style.RESET_ALL}")
-                    elif response.status_code == 404:
-                        print(f"{Fore.YELLOW}⚠ Collection not found{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.YELLOW}⚠ HTTP {response.status_code} response{Style.RESET_ALL}")
+                            print(f"{Fore.YELLOW}⚠ HTTP {response.status_code} response{Style.RESET_ALL}")
                         
                 except requests.RequestException as e:
                     print(f"{Fore.YELLOW}⚠ Request failed: {e}{Style.RESET_ALL}")
@@ -339,13 +607,14 @@ class MTGCardSorter:
                 print(f"     - Save as 'moxfield_export.csv' in this directory")
                 return False
             
-            # Reload the collection
+            # Reload the collection; an imported file may be older than the old snapshot
+            self._discard_snapshot()
             self.load_cards()
             
             if self.cards_df is not None:
                 print(f"{Fore.GREEN}✓ Collection import completed successfully!{Style.RESET_ALL}")
                 print(f"   - {len(self.cards_df)} unique cards imported")
-                print(f"   - {self.cards_df['Count'].sum()} total cards")
+                print(f"   - {self.total_count()} total cards")
                 return True
             else:
                 print(f"{Fore.RED}✗ Failed to load imported collection{Style.RESET_ALL}")
@@ -355,8 +624,12 @@ class MTGCardSorter:
             print(f"{Fore.RED}✗ Error importing collection: {e}{Style.RESET_ALL}")
             return False
 
-    def import_from_file(self, file_path: str, backup_existing: bool = True) -> bool:
-        """Import collection from a downloaded CSV file."""
+    def import_from_file(self, file_path: str, backup_existing: bool = True, move: bool = False) -> bool:
+        """Import collection from a downloaded CSV file.
+        
+        With move=True the file is moved into place instead of copied, which is a
+        cheap rename on the same filesystem.
+        """
         print(f"{Fore.CYAN}Importing collection from file: {file_path}{Style.RESET_ALL}")
         
         if not Path(file_path).exists():
@@ -373,17 +646,27 @@ class MTGCardSorter:
                 print(f"{Fore.YELLOW}⚠ Could not backup existing file: {e}{Style.RESET_ALL}")
         
         try:
-            # Copy the file to our standard location
-            shutil.copy2(file_path, self.csv_file)
-            print(f"{Fore.GREEN}✓ Collection file copied successfully{Style.RESET_ALL}")
+            # Move or copy the file to our standard location
+            if move:
+                try:
+                    os.replace(file_path, self.csv_file)
+                except OSError:
+                    # Different filesystem: fall back to copy, then drop the source
+                    shutil.copy2(file_path, self.csv_file)
+                    os.remove(file_path)
+                print(f"{Fore.GREEN}✓ Collection file moved successfully{Style.RESET_ALL}")
+            else:
+                shutil.copy2(file_path, self.csv_file)
+                print(f"{Fore.GREEN}✓ Collection file copied successfully{Style.RESET_ALL}")
             
-            # Reload the collection
+            # Reload the collection; an imported file may be older than the old snapshot
+            self._discard_snapshot()
             self.load_cards()
             
             if self.cards_df is not None:
                 print(f"{Fore.GREEN}✓ Collection import completed successfully!{Style.RESET_ALL}")
                 print(f"   - {len(self.cards_df)} unique cards imported")
-                print(f"   - {self.cards_df['Count'].sum()} total cards")
+                print(f"   - {self.total_count()} total cards")
                 return True
             else:
                 print(f"{Fore.RED}✗ Failed to load imported collection{Style.RESET_ALL}")
@@ -443,13 +726,16 @@ def main():
     parser.add_argument("--import-url", help="Import collection from URL (Moxfield supported)")
     parser.add_argument("--import-file", help="Import collection from a local CSV file")
     parser.add_argument("--no-backup", action="store_true", help="Skip backup when importing")
+    parser.add_argument("--move", action="store_true", help="Move the --import-file into place instead of copying it")
+    parser.add_argument("--ascii-table", action="store_true", help="Print full grid tables with tabulate")
+    parser.add_argument("--chunksize", type=int, help="Read the CSV in chunks of this many rows (streams --sort exports)")
     
     args = parser.parse_args()
     
     # Handle URL import first if specified
     if args.import_url:
         print(f"{Fore.CYAN}=== Collection Import ==={Style.RESET_ALL}")
-        sorter = MTGCardSorter(args.csv)
+        sorter = MTGCardSorter(args.csv, chunksize=args.chunksize, ascii_table=args.ascii_table)
         success = sorter.update_from_url(args.import_url)
         if success:
             print(f"\n{Fore.GREEN}Collection import completed! You can now use other commands.{Style.RESET_ALL}")
@@ -460,8 +746,8 @@ def main():
     # Handle file import
     if args.import_file:
         print(f"{Fore.CYAN}=== Collection File Import ==={Style.RESET_ALL}")
-        sorter = MTGCardSorter(args.csv)
-        success = sorter.import_from_file(args.import_file, backup_existing=not args.no_backup)
+        sorter = MTGCardSorter(args.csv, chunksize=args.chunksize, ascii_table=args.ascii_table)
+        success = sorter.import_from_file(args.import_file, backup_existing=not args.no_backup, move=args.move)
         if success:
             print(f"\n{Fore.GREEN}Collection import completed! You can now use other commands.{Style.RESET_ALL}")
             # Show summary after successful import
@@ -469,7 +755,7 @@ def main():
         return
     
     # Create the sorter instance
-    sorter = MTGCardSorter(args.csv)
+    sorter = MTGCardSorter(args.csv, chunksize=args.chunksize, ascii_table=args.ascii_table)
     
     if args.summary:
         sorter.display_summary()
@@ -482,7 +768,7 @@ def main():
     elif args.sort:
         sorter.export_sorted_collection(args.sort)
     elif args.import_file:
-        sorter.import_from_file(args.import_file, not args.no_backup)
+        sorter.import_from_file(args.import_file, not args.no_backup, move=args.move)
     else:
         # Interactive mode
         print(f"\n{Fore.CYAN}Welcome to MyManaBox - MTG Card Sorter!{Style.RESET_ALL}")
@@ -497,32 +783,31 @@ def main():
         print("8. Sort by type")
         print("9. Exit")
         
+        # Menu choice -> action; search prompts for its query, "9" exits the loop
+        actions = {
+            "1": sorter.display_summary,
+            "2": sorter.get_collection_statistics,
+            "3": sorter.find_duplicates,
+            "4": lambda: sorter.search_cards(input("Enter search term: ")),
+            "5": lambda: sorter.export_sorted_collection("color"),
+            "6": lambda: sorter.export_sorted_collection("set"),
+            "7": lambda: sorter.export_sorted_collection("rarity"),
+            "8": lambda: sorter.export_sorted_collection("type"),
+        }
+        
         while True:
             try:
                 choice = input(f"\n{Fore.YELLOW}Enter your choice (1-9): {Style.RESET_ALL}")
                 
-                if choice == "1":
-                    sorter.display_summary()
-                elif choice == "2":
-                    sorter.get_collection_statistics()
-                elif choice == "3":
-                    sorter.find_duplicates()
-                elif choice == "4":
-                    query = input("Enter search term: ")
-                    sorter.search_cards(query)
-                elif choice == "5":
-                    sorter.export_sorted_collection("color")
-                elif choice == "6":
-                    sorter.export_sorted_collection("set")
-                elif choice == "7":
-                    sorter.export_sorted_collection("rarity")
-                elif choice == "8":
-                    sorter.export_sorted_collection("type")
-                elif choice == "9":
+                if choice == "9":
                     print(f"{Fore.GREEN}Thanks for using MyManaBox!{Style.RESET_ALL}")
                     break
-                else:
+                
+                action = actions.get(choice)
+                if action is None:
                     print(f"{Fore.RED}Invalid choice. Please enter 1-9.{Style.RESET_ALL}")
+                else:
+                    action()
                     
             except KeyboardInterrupt:
                 print(f"\n{Fore.GREEN}Thanks for using MyManaBox!{Style.RESET_ALL}")
@@ -4,15 +4,15 @@ Enhanced MTG Card Sorter with API Integration
 Uses Scryfall API for accurate card data and improved sorting.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from collections import defaultdict
 import argparse
 from colorama import init, Fore, Style
 from tabulate import tabulate
 from scryfall_api import ScryfallAPI
-from card_sorter import MTGCardSorter
+from card_sorter import MTGCardSorter, RARITY_PRICE_BOUNDS, write_csv
 
 # Initialize colorama for Windows compatibility
 init()
@@ -26,6 +26,7 @@ class EnhancedMTGCardSorter(MTGCardSorter):
         self.use_api = use_api
         self.api = ScryfallAPI() if use_api else None
         self.enriched_data = {}
+        self._prefetched = False
         
         if self.use_api:
             print(f"{Fore.YELLOW}⚠ API enrichment enabled. This may take some time...{Style.RESET_ALL}")
@@ -37,6 +38,9 @@ class EnhancedMTGCardSorter(MTGCardSorter):
         if cache_key in self.enriched_data:
             return self.enriched_data[cache_key]
         
+        if self.api and not self._prefetched:
+            self.prefetch_card_data()
+        
         if self.api:
             api_data = self.api.get_card_data(card_name, set_code)
             if api_data:
@@ -52,100 +56,123 @@ class EnhancedMTGCardSorter(MTGCardSorter):
             "rarity": "unknown"
         }
     
+    def prefetch_card_data(self):
+        """Warm the API cache for the whole collection with batched requests.
+        
+        Per-card lookups afterwards are answered from the cache instead of
+        issuing one search request per card.
+        """
+        self._prefetched = True
+        if self.api is None or self.cards_df is None:
+            return
+        
+        cards = [
+            (name, edition)
+            for name, edition in zip(self.cards_df['Name'], self.cards_df['Edition'])
+            if isinstance(edition, str)
+        ]
+        self.api.get_cards_data(cards)
+    
+    def _enriched_frame(self) -> pd.DataFrame:
+        """Enrich each distinct (Name, Edition) pair once, one row per pair."""
+        pairs = self.cards_df[['Name', 'Edition']].drop_duplicates()
+        records = [self.enrich_card_data(name, edition) for name, edition in zip(pairs['Name'], pairs['Edition'])]
+        # Column order follows the fullest record, not whichever card happens to come first
+        columns = list(dict.fromkeys([*max(records, key=len, default={}), *(k for r in records for k in r)]))
+        enriched = pd.DataFrame.from_records(records, index=pairs.index, columns=columns)
+        return pd.concat([pairs, enriched], axis=1)
+    
+    def _merge_enriched(self, enriched: pd.DataFrame) -> pd.DataFrame:
+        """Attach the enrichment for each card's (Name, Edition) pair to every row."""
+        merged = self.cards_df.merge(enriched, how='left', on=['Name', 'Edition'])
+        merged.index = self.cards_df.index
+        return merged
+    
+    @staticmethod
+    def _split_rows(merged: pd.DataFrame, labels: pd.Series) -> Dict[str, List]:
+        """Split merged rows into record lists by label, in order of first appearance."""
+        return {group: rows.to_dict('records') for group, rows in merged.groupby(labels, sort=False)}
+    
+    @staticmethod
+    def _column(enriched: pd.DataFrame, column: str, default: Any) -> pd.Series:
+        """Return an enrichment column, filling cards that lack the field."""
+        if column not in enriched:
+            return pd.Series(default, index=enriched.index)
+        return enriched[column].fillna(default)
+    
     def sort_by_color_accurate(self) -> Dict[str, List]:
         """Sort cards by color using API data for accuracy."""
         if self.cards_df is None:
             return {}
         
-        color_groups = defaultdict(list)
-        
-        for _, card in self.cards_df.iterrows():
-            enriched = self.enrich_card_data(card['Name'], card['Edition'])
-            color_name = self.api.get_color_name(enriched.get('color_identity', [])) if self.api else 'Unknown'
-            color_groups[color_name].append({**card.to_dict(), **enriched})
+        enriched = self._enriched_frame()
+        if self.api:
+            identity = enriched['color_identity'] if 'color_identity' in enriched else pd.Series([[]] * len(enriched), index=enriched.index)
+            enriched['_group'] = identity.map(lambda ci: self.api.get_color_name(ci if isinstance(ci, list) else []))
+        else:
+            enriched['_group'] = 'Unknown'
         
-        return dict(color_groups)
+        merged = self._merge_enriched(enriched)
+        return self._split_rows(merged, merged.pop('_group'))
     
     def sort_by_type_accurate(self) -> Dict[str, List]:
         """Sort cards by type using API data."""
         if self.cards_df is None:
             return {}
         
-        type_groups = defaultdict(list)
+        enriched = self._enriched_frame()
+        type_line = self._column(enriched, 'type_line', '')
         
-        for _, card in self.cards_df.iterrows():
-            enriched = self.enrich_card_data(card['Name'], card['Edition'])
-            type_line = enriched.get('type_line', '')
-            
-            # Determine primary type
-            if 'Land' in type_line:
-                primary_type = 'Lands'
-            elif 'Creature' in type_line:
-                primary_type = 'Creatures'
-            elif 'Instant' in type_line:
-                primary_type = 'Instants'
-            elif 'Sorcery' in type_line:
-                primary_type = 'Sorceries'
-            elif 'Artifact' in type_line:
-                primary_type = 'Artifacts'
-            elif 'Enchantment' in type_line:
-                primary_type = 'Enchantments'
-            elif 'Planeswalker' in type_line:
-                primary_type = 'Planeswalkers'
-            else:
-                primary_type = 'Other'
-            
-            type_groups[primary_type].append({**card.to_dict(), **enriched})
+        # Determine primary type; the first match in this order wins
+        primary_types = {
+            'Land': 'Lands',
+            'Creature': 'Creatures',
+            'Instant': 'Instants',
+            'Sorcery': 'Sorceries',
+            'Artifact': 'Artifacts',
+            'Enchantment': 'Enchantments',
+            'Planeswalker': 'Planeswalkers',
+        }
+        conditions = [type_line.str.contains(word, regex=False) for word in primary_types]
+        enriched['_group'] = np.select(conditions, list(primary_types.values()), default='Other')
         
-        return dict(type_groups)
+        merged = self._merge_enriched(enriched)
+        return self._split_rows(merged, merged.pop('_group'))
     
     def sort_by_rarity_accurate(self) -> Dict[str, List]:
         """Sort cards by rarity using API data."""
         if self.cards_df is None:
             return {}
         
-        rarity_groups = defaultdict(list)
+        enriched = self._enriched_frame()
+        enriched['_group'] = self._column(enriched, 'rarity', 'unknown').str.title()
         
-        for _, card in self.cards_df.iterrows():
-            enriched = self.enrich_card_data(card['Name'], card['Edition'])
-            rarity = enriched.get('rarity', 'unknown').title()
-            
-            if rarity == 'Unknown':
-                # Fallback to price-based estimation
-                price = float(str(card['Purchase Price']).replace('$', '') or 0)
-                if price < 0.50:
-                    rarity = 'Common'
-                elif price < 2.00:
-                    rarity = 'Uncommon'
-                elif price < 10.00:
-                    rarity = 'Rare'
-                else:
-                    rarity = 'Mythic'
-            
-            rarity_groups[rarity].append({**card.to_dict(), **enriched})
+        merged = self._merge_enriched(enriched)
+        rarity = merged.pop('_group')
+        unknown = (rarity == 'Unknown').to_numpy()
+        if unknown.any():
+            # Fallback to price-based estimation
+            tiers = np.array(['Common', 'Uncommon', 'Rare', 'Mythic'])
+            prices = self.prices.to_numpy()[unknown]
+            rarity[unknown] = tiers[np.searchsorted(RARITY_PRICE_BOUNDS, prices, side='right')]
         
-        return dict(rarity_groups)
+        return self._split_rows(merged, rarity)
     
     def analyze_mana_curve(self):
         """Analyze the mana curve of the collection."""
         if self.cards_df is None:
             return
         
-        mana_costs = defaultdict(int)
+        enriched = self._enriched_frame()
+        cmc = pd.to_numeric(self._column(enriched, 'cmc', 0))
+        enriched['_cost'] = np.where(cmc >= 7, '7+', cmc.astype(int).astype(str))
         
-        for _, card in self.cards_df.iterrows():
-            enriched = self.enrich_card_data(card['Name'], card['Edition'])
-            cmc = enriched.get('cmc', 0)
-            count = card['Count']
-            
-            if cmc >= 7:
-                mana_costs['7+'] += count
-            else:
-                mana_costs[str(int(cmc))] += count
+        merged = self._merge_enriched(enriched[['Name', 'Edition', '_cost']])
+        mana_costs = merged.groupby('_cost')['Count'].sum()
         
         print(f"\n{Fore.CYAN}=== Mana Curve Analysis ==={Style.RESET_ALL}")
         for cost in ['0', '1', '2', '3', '4', '5', '6', '7+']:
-            count = mana_costs.get(cost, 0)
+            count = int(mana_costs.get(cost, 0))
             bar = '█' * min(count // 5, 50)  # Scale the bar
             print(f"CMC {cost}: {count:3d} {bar}")
     
@@ -218,7 +245,7 @@ class EnhancedMTGCardSorter(MTGCardSorter):
                 
                 filename = f"enhanced_{sort_type}_{group_name.replace(' ', '_').lower()}.csv"
                 filepath = output_path / filename
-                df.to_csv(filepath, index=False)
+                write_csv(df, filepath)
                 print(f"{Fore.GREEN}✓ Exported {len(cards)} cards to {filepath}{Style.RESET_ALL}")
 
 
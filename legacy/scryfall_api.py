@@ -7,41 +7,157 @@ Provides integration with Scryfall API for accurate card data.
 import requests
 import time
 import json
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 class ScryfallAPI:
     """Interface to Scryfall API for MTG card data."""
     
     BASE_URL = "https://api.scryfall.com"
+    CACHE_TTL = 30 * 24 * 60 * 60  # Seconds before a cached card is fetched again
+    BATCH_SIZE = 75  # Maximum identifiers accepted by /cards/collection
+    REQUEST_TIMEOUT = 30  # Seconds before a stalled request is abandoned
     
     def __init__(self, cache_file: str = "card_cache.json"):
         """Initialize with optional caching."""
         self.cache_file = Path(cache_file)
-        self.cache = self._load_cache()
+        # When each entry was fetched, in a sidecar file: the cache itself is
+        # shared with ScryfallClient and must only hold card entries
+        self.timestamps_file = self.cache_file.with_suffix('.timestamps.json')
+        self.cache = self._load_json(self.cache_file)
+        self.cached_at = self._load_json(self.timestamps_file)
         
-    def _load_cache(self) -> Dict:
-        """Load cached card data."""
-        if self.cache_file.exists():
+    @staticmethod
+    def _load_json(path: Path) -> Dict:
+        """Load a JSON object, or an empty dict if it is missing or unreadable."""
+        if path.exists():
             try:
-                with open(self.cache_file, 'r') as f:
+                if HAS_ORJSON:
+                    with open(path, 'rb') as f:
+                        return orjson.loads(f.read())
+                with open(path, 'r') as f:
                     return json.load(f)
             except:
                 return {}
         return {}
     
     def _save_cache(self):
-        """Save cache to file."""
+        """Save cache and fetch times to file."""
         with open(self.cache_file, 'w') as f:
             json.dump(self.cache, f, indent=2)
+        with open(self.timestamps_file, 'w') as f:
+            json.dump(self.cached_at, f)
+    
+    def _store(self, cache_key: str, card_info: Dict[str, Any]):
+        """Cache a card and record when it was fetched."""
+        self.cache[cache_key] = card_info
+        self.cached_at[cache_key] = time.time()
+    
+    def _cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached card unless it is older than CACHE_TTL.
+        
+        Expired entries stay in self.cache as a fallback for failed refreshes.
+        """
+        card_info = self.cache.get(cache_key)
+        if card_info is None:
+            return None
+        # Entries written before expiry was tracked have no timestamp and stay valid
+        fetched = self.cached_at.get(cache_key)
+        if fetched is not None and time.time() - fetched > self.CACHE_TTL:
+            return None
+        return card_info
+    
+    @staticmethod
+    def _card_info(card: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the fields we keep from a Scryfall card object."""
+        return {
+            "name": card.get("name"),
+            "mana_cost": card.get("mana_cost", ""),
+            "cmc": card.get("cmc", 0),
+            "colors": card.get("colors", []),
+            "color_identity": card.get("color_identity", []),
+            "type_line": card.get("type_line", ""),
+            "rarity": card.get("rarity", ""),
+            "set": card.get("set", ""),
+            "set_name": card.get("set_name", ""),
+            "collector_number": card.get("collector_number", ""),
+            "prices": card.get("prices", {}),
+            "scryfall_uri": card.get("scryfall_uri", "")
+        }
+    
+    def get_cards_data(self, cards: Iterable[Tuple[str, Optional[str]]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch many (name, set_code) pairs at once, keyed like get_card_data's cache.
+        
+        Uncached cards are requested BATCH_SIZE at a time through /cards/collection
+        and the cache file is written once at the end, instead of one search
+        request and one cache write per card.
+        """
+        results = {}
+        missing: List[Tuple[str, Optional[str]]] = []
+        for name, set_code in dict.fromkeys(cards):
+            cache_key = f"{name}_{set_code or 'any'}"
+            card_info = self._cached(cache_key)
+            if card_info is None:
+                missing.append((name, set_code))
+            else:
+                results[cache_key] = card_info
+        
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            batch = missing[start:start + self.BATCH_SIZE]
+            identifiers = [
+                {"name": name, "set": set_code} if set_code else {"name": name}
+                for name, set_code in batch
+            ]
+            
+            # Rate limiting - Scryfall allows 10 requests per second
+            time.sleep(0.1)
+            
+            try:
+                response = requests.post(
+                    f"{self.BASE_URL}/cards/collection",
+                    json={"identifiers": identifiers},
+                    timeout=self.REQUEST_TIMEOUT,
+                )
+                response.raise_for_status()
+                found = {}
+                for card in response.json().get("data", []):
+                    found[(card.get("name", "").lower(), card.get("set", ""))] = card
+                    found.setdefault((card.get("name", "").lower(), None), card)
+            except requests.RequestException as e:
+                print(f"API Error for batch of {len(batch)} cards: {e}")
+                continue
+            
+            for name, set_code in batch:
+                card = found.get((name.lower(), set_code.lower() if set_code else None))
+                if card is not None:
+                    cache_key = f"{name}_{set_code or 'any'}"
+                    results[cache_key] = self._card_info(card)
+                    self._store(cache_key, results[cache_key])
+        
+        # Cards that could not be refreshed keep their expired data
+        for name, set_code in missing:
+            cache_key = f"{name}_{set_code or 'any'}"
+            if cache_key not in results and cache_key in self.cache:
+                results[cache_key] = self.cache[cache_key]
+        
+        if missing:
+            self._save_cache()
+        return results
     
     def get_card_data(self, name: str, set_code: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get card data from Scryfall API with caching."""
         cache_key = f"{name}_{set_code or 'any'}"
         
         # Check cache first
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        card_info = self._cached(cache_key)
+        if card_info is not None:
+            return card_info
         
         # Rate limiting - Scryfall allows 10 requests per second
         time.sleep(0.1)
@@ -55,7 +171,7 @@ class ScryfallAPI:
             url = f"{self.BASE_URL}/cards/search"
             params = {"q": query, "unique": "cards"}
             
-            response = requests.get(url, params=params)
+            response = requests.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             data = response.json()
@@ -63,23 +179,10 @@ class ScryfallAPI:
                 card = data["data"][0]  # Get first match
                 
                 # Extract useful data
-                card_info = {
-                    "name": card.get("name"),
-                    "mana_cost": card.get("mana_cost", ""),
-                    "cmc": card.get("cmc", 0),
-                    "colors": card.get("colors", []),
-                    "color_identity": card.get("color_identity", []),
-                    "type_line": card.get("type_line", ""),
-                    "rarity": card.get("rarity", ""),
-                    "set": card.get("set", ""),
-                    "set_name": card.get("set_name", ""),
-                    "collector_number": card.get("collector_number", ""),
-                    "prices": card.get("prices", {}),
-                    "scryfall_uri": card.get("scryfall_uri", "")
-                }
+                card_info = self._card_info(card)
                 
                 # Cache the result
-                self.cache[cache_key] = card_info
+                self._store(cache_key, card_info)
                 self._save_cache()
                 
                 return card_info
@@ -89,7 +192,8 @@ class ScryfallAPI:
         except Exception as e:
             print(f"Unexpected error for {name}: {e}")
         
-        return None
+        # A failed refresh falls back to the expired entry, if any
+        return self.cache.get(cache_key)
     
     def get_color_name(self, color_identity: list) -> str:
         """Convert color identity to readable name."""
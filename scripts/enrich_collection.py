@@ -4,34 +4,119 @@ Enrich Collection Script - Export CSV with all available Scryfall API data.
 This script will enrich your collection with comprehensive card data and export it to CSV.
 """
 
+import argparse
+import json
+import os
 import sys
+from decimal import Decimal
 from pathlib import Path
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# The src package lives in the repository root, one level above this script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.data import CSVLoader, ScryfallClient
-from src.services import CollectionService
 from colorama import init, Fore, Style
 
 init()
 
+SOURCE_FILE = "data/moxfield_export.csv"
+OUTPUT_FILE = "data/enriched_collection.csv"
+CACHE_FILE = "card_cache.json"
+# Records the inputs and output of the last export so unchanged runs can stop early
+MANIFEST_FILE = "data/enriched_collection.manifest.json"
 
-def main():
+
+def _collection_totals(cards):
+    """Return (card count, purchase value, collection value) in one pass over the cards.
+    
+    The collection value is the sum of Card.total_value, so it follows that
+    property's pricing rule instead of repeating it here.
+    """
+    total_count = 0
+    purchase_total = Decimal('0')
+    value_total = Decimal('0')
+    for card in cards:
+        total_count += card.count
+        if card.purchase_price:
+            purchase_total += card.purchase_price * card.count
+        value_total += card.total_value
+    return total_count, purchase_total, value_total
+
+
+def _file_stamp(path):
+    """Return [mtime_ns, size] for path, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _export_stamps():
+    """Stamp the source CSV, the Scryfall cache and the export they produced."""
+    return {
+        'source': _file_stamp(SOURCE_FILE),
+        'cache': _file_stamp(CACHE_FILE),
+        'output': _file_stamp(OUTPUT_FILE),
+    }
+
+
+def _export_is_fresh():
+    """True if the export was written from the current source CSV and cache."""
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    stamps = _export_stamps()
+    return stamps['source'] is not None and stamps['output'] is not None and manifest == stamps
+
+
+def _write_manifest():
+    """Record the files behind the export that was just written."""
+    try:
+        with open(MANIFEST_FILE, 'w') as f:
+            json.dump(_export_stamps(), f)
+    except OSError:
+        # The manifest only saves work; without it the next run enriches again
+        pass
+
+
+def _discard_manifest():
+    """Forget the last export so the next run enriches again."""
+    try:
+        os.remove(MANIFEST_FILE)
+    except OSError:
+        pass
+
+
+def main(argv=None):
     """Enrich and export collection with all Scryfall data."""
+    parser = argparse.ArgumentParser(description="Export the collection with all available Scryfall data")
+    parser.add_argument("--force", action="store_true", help="Enrich even if the export is up to date")
+    args = parser.parse_args(argv)
+    
     print(f"{Fore.CYAN}MyManaBox - Collection Enrichment Tool{Style.RESET_ALL}")
     print("=" * 50)
     
+    # Nothing to do if neither the collection nor the cache changed since the last export
+    if not args.force and _export_is_fresh():
+        print(f"{Fore.GREEN}✓ {OUTPUT_FILE} is up to date with {SOURCE_FILE}{Style.RESET_ALL}")
+        return 0
+    
+    # Imported here so the up-to-date check above does not pay for pandas and requests
+    from src.data import CSVLoader, ScryfallClient
+    from src.models import Card
+    from src.services import CollectionService
+    
     # Create services
-    csv_loader = CSVLoader("data/moxfield_export.csv")
-    scryfall_client = ScryfallClient()
+    csv_loader = CSVLoader(SOURCE_FILE, memory_map=True)
+    scryfall_client = ScryfallClient(CACHE_FILE)
     collection_service = CollectionService(csv_loader, scryfall_client)
     
     # Load collection
     print(f"{Fore.YELLOW}Loading collection...{Style.RESET_ALL}")
     if not collection_service.load_collection():
-        print(f"{Fore.RED}Failed to load collection from data/moxfield_export.csv{Style.RESET_ALL}")
+        print(f"{Fore.RED}Failed to load collection from {SOURCE_FILE}{Style.RESET_ALL}")
         return 1
     
     collection = collection_service.get_collection()
@@ -39,8 +124,12 @@ def main():
         print(f"{Fore.RED}Collection is empty{Style.RESET_ALL}")
         return 1
     
-    print(f"{Fore.GREEN}✓ Loaded {collection.unique_cards} unique cards ({collection.total_cards} total){Style.RESET_ALL}")
-    print(f"Current purchase value: ${collection.total_value:.2f}")
+    # Collection.total_cards and total_value each walk every card; take both in one pass
+    cards = collection.cards
+    unique_cards = len(cards)
+    total_cards, _, current_value = _collection_totals(cards)
+    print(f"{Fore.GREEN}✓ Loaded {unique_cards} unique cards ({total_cards} total){Style.RESET_ALL}")
+    print(f"Current purchase value: ${current_value:.2f}")
     
     # Show what will be enriched
     print(f"\n{Fore.CYAN}This tool will enrich your collection with:{Style.RESET_ALL}")
@@ -56,7 +145,7 @@ def main():
     print("• Card properties (reserved, promo, etc.)")
     
     # Estimate time
-    print(f"\n{Fore.YELLOW}Estimated time: {(collection.unique_cards * 0.05 / 60):.1f} minutes{Style.RESET_ALL}")
+    print(f"\n{Fore.YELLOW}Estimated time: {(unique_cards * 0.05 / 60):.1f} minutes{Style.RESET_ALL}")
     print(f"(Rate limited to respect Scryfall API)")
     
     # Confirm
@@ -66,24 +155,32 @@ def main():
         return 0
     
     # Export enriched collection
-    output_file = "data/enriched_collection.csv"
-    success = collection_service.export_enriched_collection(output_file)
+    enriched_count, bytes_written = collection_service.enrich_and_export(OUTPUT_FILE)
     
-    if success:
+    # Only a complete export may be skipped next time; cards that failed are retried
+    if bytes_written and enriched_count == unique_cards:
+        _write_manifest()
+    else:
+        _discard_manifest()
+    
+    if bytes_written:
+        if enriched_count < unique_cards:
+            print(f"{Fore.YELLOW}⚠ {unique_cards - enriched_count} cards could not be enriched; "
+                  f"run again to retry them{Style.RESET_ALL}")
+        
         # Show updated values
         print(f"\n{Fore.GREEN}=== Results ==={Style.RESET_ALL}")
-        print(f"Purchase value: ${sum(card.purchase_price * card.count for card in collection.cards if card.purchase_price):.2f}")
-        print(f"Current market value: ${collection.total_value:.2f}")
-        difference = collection.total_value - sum(card.purchase_price * card.count for card in collection.cards if card.purchase_price)
+        _, purchase_value, market_value = _collection_totals(cards)
+        print(f"Purchase value: ${purchase_value:.2f}")
+        print(f"Current market value: ${market_value:.2f}")
+        difference = market_value - purchase_value
         print(f"Value appreciation: ${difference:.2f}")
         
         # Show file info
-        output_path = Path(output_file)
-        if output_path.exists():
-            size_mb = output_path.stat().st_size / (1024 * 1024)
-            print(f"\nEnriched CSV saved: {output_file} ({size_mb:.1f} MB)")
+        size_mb = bytes_written / (1024 * 1024)
+        print(f"\nEnriched CSV saved: {OUTPUT_FILE} ({size_mb:.1f} MB)")
         
-        print(f"\n{Fore.CYAN}The enriched CSV includes {len(collection.cards[0].to_dict())} columns with comprehensive card data!{Style.RESET_ALL}")
+        print(f"\n{Fore.CYAN}The enriched CSV includes {len(Card.csv_columns())} columns with comprehensive card data!{Style.RESET_ALL}")
         return 0
     else:
         print(f"{Fore.RED}Failed to export enriched collection{Style.RESET_ALL}")
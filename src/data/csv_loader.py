@@ -1,17 +1,30 @@
 """CSV file loading functionality."""
 
+import csv
+import os
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from ..models import Collection, Card
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Exports are a few MB; a large buffer turns them into a handful of write calls
+WRITE_BUFFER_BYTES = 1024 * 1024
+
 
 class CSVLoader:
     """Handles loading and saving collections from/to CSV files."""
     
-    def __init__(self, file_path: str = "moxfield_export.csv"):
-        """Initialize with CSV file path."""
+    def __init__(self, file_path: str = "moxfield_export.csv", memory_map: bool = False):
+        """Initialize with CSV file path; memory_map reads it through mmap instead of read() copies."""
         self.file_path = Path(file_path)
+        self.memory_map = memory_map
     
     def load_collection(self, name: str = "My Collection") -> Optional[Collection]:
         """Load collection from CSV file."""
@@ -19,32 +32,45 @@ class CSVLoader:
             if not self.file_path.exists():
                 raise FileNotFoundError(f"Could not find {self.file_path}")
             
-            df = pd.read_csv(self.file_path)
-            csv_data = df.to_dict('records')
+            # pyarrow's multi-threaded parser builds the row dicts directly
+            if HAS_PYARROW and self.memory_map:
+                with pa.memory_map(str(self.file_path)) as source:
+                    csv_data = pacsv.read_csv(source).to_pylist()
+            elif HAS_PYARROW:
+                csv_data = pacsv.read_csv(self.file_path).to_pylist()
+            else:
+                csv_data = pd.read_csv(self.file_path, memory_map=self.memory_map).to_dict('records')
             return Collection.from_csv_data(csv_data, name)
             
         except Exception as e:
             print(f"Error loading CSV: {e}")
             return None
     
-    def save_collection(self, collection: Collection, file_path: Optional[str] = None) -> bool:
-        """Save collection to CSV file."""
+    def save_collection(self, collection: Collection, file_path: Optional[str] = None,
+                        buffer_size: int = WRITE_BUFFER_BYTES) -> Optional[int]:
+        """Save collection to CSV file, writing through a buffer of buffer_size bytes.
+        
+        Returns the number of bytes written, or None if saving failed.
+        """
+        return self.save_cards(collection.cards, file_path, buffer_size)
+    
+    def save_cards(self, cards: Iterable[Card], file_path: Optional[str] = None,
+                   buffer_size: int = WRITE_BUFFER_BYTES) -> Optional[int]:
+        """Save cards to CSV as they arrive from any iterable, e.g. a producer queue.
+        
+        Returns the number of bytes written, or None if saving failed.
+        """
         try:
             output_path = Path(file_path) if file_path else self.file_path
             
-            # Convert cards to dictionaries
-            data = [card.to_dict() for card in collection.cards]
-            df = pd.DataFrame(data)
-            
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            df.to_csv(output_path, index=False)
-            return True
+            return self._write_cards(cards, output_path, buffer_size)
             
         except Exception as e:
             print(f"Error saving CSV: {e}")
-            return False
+            return None
     
     def export_grouped_collections(self, grouped_cards: Dict[str, List[Card]], 
                                   output_dir: str = "sorted_output", 
@@ -56,15 +82,23 @@ class CSVLoader:
             
             for group_name, cards in grouped_cards.items():
                 if cards:  # Only create files for non-empty groups
-                    data = [card.to_dict() for card in cards]
-                    df = pd.DataFrame(data)
-                    
                     filename = f"{prefix}_{group_name.replace(' ', '_').lower()}.csv"
                     filepath = output_path / filename
-                    df.to_csv(filepath, index=False)
+                    self._write_cards(cards, filepath)
             
             return True
             
         except Exception as e:
             print(f"Error exporting grouped collections: {e}")
             return False
+    
+    @staticmethod
+    def _write_cards(cards: Iterable[Card], output_path: Path, buffer_size: int = WRITE_BUFFER_BYTES) -> int:
+        """Stream cards to a CSV file one row at a time and return the bytes written."""
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=buffer_size) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(Card.csv_columns())
+            # to_dict always yields its keys in csv_columns() order
+            writer.writerows(card.to_dict().values() for card in cards)
+            f.flush()
+            return os.fstat(f.fileno()).st_size
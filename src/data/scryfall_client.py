@@ -1,23 +1,47 @@
 """Scryfall API client for card data enrichment."""
 
 import requests
+import sys
 import time
 import json
 from decimal import Decimal
-from typing import Dict, Optional, Any, Set, List
+from typing import Dict, Optional, Any, Set, List, Iterator, Tuple
 from pathlib import Path
 from ..models import Card, CardColor, CardRarity, CardType
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class ScryfallClient:
     """Client for interacting with Scryfall API."""
     
     BASE_URL = "https://api.scryfall.com"
     
+    RARITY_MAP = {
+        'common': CardRarity.COMMON,
+        'uncommon': CardRarity.UNCOMMON,
+        'rare': CardRarity.RARE,
+        'mythic': CardRarity.MYTHIC,
+        'special': CardRarity.SPECIAL
+    }
+    
+    # Scryfall fields with a handful of distinct values repeated across every card
+    INTERNED_FIELDS = (
+        'rarity', 'border_color', 'frame', 'layout', 'set_type',
+        'security_stamp', 'image_status', 'set_name',
+    )
+    
     def __init__(self, cache_file: str = "card_cache.json"):
         """Initialize with optional caching."""
         self.cache_file = Path(cache_file)
         self.cache = self._load_cache()
+        for card_data in self.cache.values():
+            self._intern_values(card_data)
+        self._name_index = self._build_name_index(self.cache)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'MyManaBox/1.0 (https://github.com/user/MyManaBox)'
@@ -27,12 +51,44 @@ class ScryfallClient:
         """Load cached card data."""
         if self.cache_file.exists():
             try:
+                if HAS_ORJSON:
+                    with open(self.cache_file, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(self.cache_file, 'r') as f:
                     return json.load(f)
             except:
                 return {}
         return {}
     
+    @classmethod
+    def _intern_values(cls, data: Dict[str, Any]) -> None:
+        """Share one string object per distinct low-cardinality value across cached cards."""
+        for field in cls.INTERNED_FIELDS:
+            value = data.get(field)
+            if type(value) is str:
+                data[field] = sys.intern(value)
+        
+        legalities = data.get('legalities')
+        if isinstance(legalities, dict):
+            for fmt, status in legalities.items():
+                if type(status) is str:
+                    legalities[fmt] = sys.intern(status)
+    
+    @staticmethod
+    def _build_name_index(cache: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Map each lowercased card name to its cache keys (one per cached printing)."""
+        index: Dict[str, List[str]] = {}
+        for cache_key in cache:
+            name, sep, _ = cache_key.rpartition('|')
+            if sep:  # The cache file is shared with the legacy 'name_set' keys
+                index.setdefault(name, []).append(cache_key)
+        return index
+    
+    def _find_any_printing(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return cached data for any printing of a card, via the name index."""
+        cache_keys = self._name_index.get(name.lower())
+        return self.cache[cache_keys[0]] if cache_keys else None
+    
     def _save_cache(self) -> None:
         """Save cache to file."""
         try:
@@ -47,8 +103,10 @@ class ScryfallClient:
     
     def enrich_card(self, card: Card) -> bool:
         """Enrich card with data from Scryfall API."""
-        cache_key = self._get_cache_key(card.name, card.edition)
-        
+        return self._enrich_card(card, self._get_cache_key(card.name, card.edition))
+    
+    def _enrich_card(self, card: Card, cache_key: str) -> bool:
+        """Enrich card whose cache key has already been built."""
         # Check cache first
         if cache_key in self.cache:
             self._apply_card_data(card, self.cache[cache_key])
@@ -57,7 +115,9 @@ class ScryfallClient:
         # Make API request
         card_data = self._fetch_card_data(card.name, card.edition)
         if card_data:
+            self._intern_values(card_data)
             self.cache[cache_key] = card_data
+            self._name_index.setdefault(card.name.lower(), []).append(cache_key)
             self._apply_card_data(card, card_data)
             self._save_cache()
             return True
@@ -108,14 +168,7 @@ class ScryfallClient:
             
             # Rarity
             if 'rarity' in data:
-                rarity_map = {
-                    'common': CardRarity.COMMON,
-                    'uncommon': CardRarity.UNCOMMON,
-                    'rare': CardRarity.RARE,
-                    'mythic': CardRarity.MYTHIC,
-                    'special': CardRarity.SPECIAL
-                }
-                card.rarity = rarity_map.get(data['rarity'])
+                card.rarity = self.RARITY_MAP.get(data['rarity'])
             
             # Type line and types
             if 'type_line' in data:
@@ -329,18 +382,23 @@ class ScryfallClient:
     
     def enrich_collection(self, cards: List[Card], progress_callback=None) -> int:
         """Enrich multiple cards with API data."""
-        enriched_count = 0
+        return sum(enriched for _, enriched in self.iter_enrich_collection(cards, progress_callback))
+    
+    def iter_enrich_collection(self, cards: List[Card], progress_callback=None) -> Iterator[Tuple[Card, bool]]:
+        """Enrich cards one at a time, yielding (card, enriched) as each one is done."""
         total_cards = len(cards)
         
         for i, card in enumerate(cards):
-            if self.enrich_card(card):
-                enriched_count += 1
+            cache_key = self._get_cache_key(card.name, card.edition)
+            cached = cache_key in self.cache
+            enriched = self._enrich_card(card, cache_key)
             
             # Progress callback
             if progress_callback:
                 progress_callback(i + 1, total_cards)
             
-            # Rate limiting
-            time.sleep(0.05)
-        
-        return enriched_count
+            yield card, enriched
+            
+            # Rate limiting; cache hits never reach the API
+            if not cached:
+                time.sleep(0.05)
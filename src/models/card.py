@@ -1,7 +1,7 @@
 """Card data model."""
 
 from dataclasses import dataclass
-from typing import Optional, Set, List
+from typing import ClassVar, Optional, Set, List, Tuple
 from decimal import Decimal
 from .enums import CardColor, CardRarity, CardType, Condition
 
@@ -106,6 +106,9 @@ class Card:
     watermark: Optional[str] = None
     preview: Optional[dict] = None
     
+    # Export column order, computed once by csv_columns()
+    _csv_columns: ClassVar[Optional[Tuple[str, ...]]] = None
+    
     def __post_init__(self):
         """Initialize default collections."""
         if self.colors is None:
@@ -258,6 +261,13 @@ class Card:
             collector_number=Card._safe_str(row_data.get('Collector Number', ''))
         )
     
+    @classmethod
+    def csv_columns(cls) -> Tuple[str, ...]:
+        """Column names produced by to_dict, in export order."""
+        if cls._csv_columns is None:
+            cls._csv_columns = tuple(cls(name="", edition="").to_dict())
+        return cls._csv_columns
+    
     def to_dict(self) -> dict:
         """Convert Card to dictionary for comprehensive CSV export."""
         # Helper function to format sets and lists
@@ -412,16 +422,20 @@ class Card:
         if value is None:
             return ""
         
-        # Handle pandas NaN values
-        try:
-            import pandas as pd
-            if pd.isna(value):
+        if type(value) is str:
+            # Strings are never NaN, so skip the NaN check and the str() copy
+            str_val = value.strip()
+        else:
+            # Missing CSV cells arrive as float NaN, the only value unequal to itself
+            if isinstance(value, float) and value != value:
+                return ""
+            
+            str_val = str(value).strip()
+            # pandas' NA and NaT, recognised without importing pandas
+            if str_val in ('<NA>', 'NaT'):
                 return ""
-        except (ImportError, TypeError):
-            pass
         
-        # Convert to string and check for 'nan'
-        str_val = str(value).strip()
+        # Check for 'nan'
         if str_val.lower() in ('nan', 'none', ''):
             return ""
         
@@ -16,15 +16,11 @@ class CardColor(Enum):
     @classmethod
     def from_colors(cls, colors: List[str]) -> Set['CardColor']:
         """Convert list of color strings to CardColor set."""
-        color_map = {
-            'W': cls.WHITE,
-            'U': cls.BLUE,
-            'B': cls.BLACK,
-            'R': cls.RED,
-            'G': cls.GREEN,
-            'C': cls.COLORLESS
-        }
-        return {color_map.get(color.upper(), cls.COLORLESS) for color in colors if color}
+        return {_COLOR_CODES.get(color.upper(), cls.COLORLESS) for color in colors if color}
+
+
+# Color symbol lookup, built once instead of on every from_colors call
+_COLOR_CODES = {color.value: color for color in CardColor}
 
 
 class CardRarity(Enum):
@@ -55,13 +51,11 @@ class CardType(Enum):
             return set()
         
         type_line = type_line.lower()
-        found_types = set()
-        
-        for card_type in cls:
-            if card_type.value.lower() in type_line:
-                found_types.add(card_type)
-        
-        return found_types
+        return {card_type for word, card_type in _TYPE_WORDS if word in type_line}
+
+
+# Lowercased type names, built once instead of on every from_type_line call
+_TYPE_WORDS = [(card_type.value.lower(), card_type) for card_type in CardType]
 
 
 class Condition(Enum):
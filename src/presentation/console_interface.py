@@ -51,8 +51,8 @@ class ConsoleInterface:
                     print(f"{Fore.YELLOW}Enriching collection with current market data...{Style.RESET_ALL}")
                     
                     def progress_callback(current, total):
-                        percent = (current / total) * 100
                         if current % 50 == 0 or current == total:  # Show progress every 50 cards
+                            percent = (current / total) * 100
                             print(f"Progress: {current}/{total} cards ({percent:.1f}%)")
                     
                     enriched_count = self.collection_service.enrich_collection_data(progress_callback)
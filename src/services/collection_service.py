@@ -1,8 +1,13 @@
 """Collection management service."""
 
-from typing import Optional, List
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Optional, List, Tuple
 from ..models import Collection, Card
 from ..data import CSVLoader, ScryfallClient
+from ..data.csv_loader import WRITE_BUFFER_BYTES
 
 
 class CollectionService:
@@ -19,11 +24,11 @@ class CollectionService:
         self.collection = self.csv_loader.load_collection(name)
         return self.collection is not None
     
-    def save_collection(self, file_path: Optional[str] = None) -> bool:
-        """Save current collection to CSV file."""
+    def save_collection(self, file_path: Optional[str] = None, buffer_size: int = WRITE_BUFFER_BYTES) -> Optional[int]:
+        """Save current collection to CSV file; returns bytes written, or None on failure."""
         if not self.collection:
-            return False
-        return self.csv_loader.save_collection(self.collection, file_path)
+            return None
+        return self.csv_loader.save_collection(self.collection, file_path, buffer_size)
     
     def get_collection(self) -> Optional[Collection]:
         """Get the current collection."""
@@ -61,19 +66,28 @@ class CollectionService:
             'foil_stats': self.collection.get_foil_stats()
         }
     
-    def export_enriched_collection(self, file_path: str = "enriched_collection.csv") -> bool:
-        """Export collection with all available Scryfall data."""
-        if not self.collection:
-            return False
+    def export_enriched_collection(self, file_path: str = "enriched_collection.csv") -> Optional[int]:
+        """Export collection with all available Scryfall data; returns bytes written, or None on failure."""
+        return self.enrich_and_export(file_path)[1]
+    
+    def enrich_and_export(self, file_path: str = "enriched_collection.csv") -> Tuple[int, Optional[int]]:
+        """Export collection with all available Scryfall data.
         
-        print(f"Enriching collection with Scryfall data...")
-        enriched_count = self.enrich_collection_data()
-        print(f"Enriched {enriched_count} cards with API data")
+        Returns (cards enriched, bytes written); bytes written is None on failure.
+        """
+        if not self.collection:
+            return 0, None
         
-        print(f"Exporting enriched collection to {file_path}...")
-        success = self.save_collection(file_path)
+        enriched_count = 0
+        if not self.scryfall_client:
+            print(f"Exporting enriched collection to {file_path}...")
+            bytes_written = self.save_collection(file_path)
+        else:
+            print(f"Enriching collection with Scryfall data and exporting to {file_path}...")
+            enriched_count, bytes_written = self._enrich_and_save(file_path)
+            print(f"Enriched {enriched_count} cards with API data")
         
-        if success:
+        if bytes_written:
             print(f"✓ Enriched collection exported to {file_path}")
             print(f"The CSV now includes comprehensive Scryfall data:")
             print("- Current market prices")
@@ -86,4 +100,45 @@ class CollectionService:
             print("- Image URLs")
             print("- Rankings and properties")
         
-        return success
+        return enriched_count, bytes_written
+    
+    def _enrich_and_save(self, file_path: str) -> Tuple[int, Optional[int]]:
+        """Write each card on a background thread as soon as it is enriched.
+        
+        Enrichment spends most of its time waiting on the API, so the rows
+        are already on disk when the last card comes back. They go to a
+        '.part' file that replaces file_path only once every card is written,
+        so an interrupted run leaves the previous export intact.
+        """
+        output_path = Path(file_path)
+        partial_path = output_path.with_name(output_path.name + '.part')
+        cards: queue.Queue = queue.Queue()
+        result: List[Optional[int]] = [None]
+        
+        def write_cards():
+            # A None sentinel marks the end of the collection
+            result[0] = self.csv_loader.save_cards(iter(cards.get, None), str(partial_path))
+        
+        writer = threading.Thread(target=write_cards, name="csv-writer")
+        writer.start()
+        enriched_count = 0
+        completed = False
+        try:
+            for card, enriched in self.scryfall_client.iter_enrich_collection(self.collection.cards):
+                enriched_count += enriched
+                if not writer.is_alive():
+                    # The writer failed; enriching the rest would only waste API calls
+                    break
+                cards.put(card)
+            else:
+                completed = True
+        finally:
+            cards.put(None)
+            writer.join()
+            completed = completed and result[0] is not None
+            if completed:
+                os.replace(partial_path, output_path)
+            elif partial_path.exists():
+                partial_path.unlink()
+        
+        return enriched_count, result[0] if completed else None
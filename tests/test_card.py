@@ -0,0 +1,34 @@
+"""Tests for the Card model."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.models import Card
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, ""),
+    (float("nan"), ""),
+    (pd.NA, ""),
+    (pd.NaT, ""),
+    ("  Lightning Bolt ", "Lightning Bolt"),
+    ("nan", ""),
+    (3, "3"),
+    (1.5, "1.5"),
+])
+def test_safe_str(value, expected):
+    assert Card._safe_str(value) == expected
+
+
+def test_importing_models_does_not_load_pandas():
+    code = "import sys, src.models; print('pandas' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
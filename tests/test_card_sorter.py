@@ -0,0 +1,157 @@
+"""Tests for the legacy MTGCardSorter."""
+
+import os
+from pathlib import Path
+
+import pytest
+import requests
+
+from card_sorter import MTGCardSorter
+
+
+MOXFIELD_CSV = (
+    "Count,Tradelist Count,Name,Edition,Condition,Language,Foil,Tags,"
+    "Last Modified,Collector Number,Alter,Proxy,Purchase Price\n"
+    "2,0,Lightning Bolt,2xm,Near Mint,English,,,2025-03-05 00:23:27.240000,141,False,False,1.50\n"
+    "1,0,Swamp,dmu,Near Mint,English,foil,,2025-03-05 00:42:14.297000,269,False,False,0.25\n"
+    "1,0,Hubris,jou,Near Mint,English,,,2025-03-05 00:42:14.297000,41,False,False,\n"
+)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "moxfield_export.csv"
+    path.write_text(MOXFIELD_CSV)
+    return path
+
+
+class _FakeResponse:
+    """Streaming response whose body raises after the given chunks."""
+    
+    def __init__(self, chunks, error=None):
+        self.status_code = 200
+        self._chunks = chunks
+        self._error = error
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def iter_content(self, chunk_size):
+        yield from self._chunks
+        if self._error:
+            raise self._error
+
+
+def test_moxfield_import_tries_next_endpoint_after_dropped_connection(csv_file, monkeypatch):
+    sorter = MTGCardSorter(str(csv_file))
+    header, rows = MOXFIELD_CSV.encode().split(b"\n", 1)
+    responses = iter([
+        _FakeResponse([header + b"\n"], requests.exceptions.ChunkedEncodingError("dropped")),
+        _FakeResponse([header + b"\n", rows]),
+    ])
+    monkeypatch.setattr(sorter._session, "get", lambda *a, **k: next(responses))
+    
+    assert sorter.import_from_moxfield_url(
+        "https://moxfield.com/collection/abc123", backup_existing=False
+    )
+    assert csv_file.read_bytes() == MOXFIELD_CSV.encode()
+    assert not Path(f"{csv_file}.part").exists()
+
+
+def test_moxfield_import_removes_partial_file_when_all_endpoints_fail(csv_file, monkeypatch):
+    sorter = MTGCardSorter(str(csv_file))
+    monkeypatch.setattr(
+        sorter._session, "get",
+        lambda *a, **k: _FakeResponse([b"Count,Name\n"], requests.ConnectionError("reset")),
+    )
+    
+    assert not sorter.import_from_moxfield_url(
+        "https://moxfield.com/collection/abc123", backup_existing=False
+    )
+    assert csv_file.read_text() == MOXFIELD_CSV
+    assert not Path(f"{csv_file}.part").exists()
+
+
+@pytest.mark.parametrize("sort_type", ["color", "set", "rarity", "type"])
+def test_chunked_export_matches_in_memory_export(csv_file, tmp_path, sort_type):
+    MTGCardSorter(str(csv_file)).export_sorted_collection(sort_type, str(tmp_path / "whole"))
+    MTGCardSorter(str(csv_file), chunksize=1).export_sorted_collection(
+        sort_type, str(tmp_path / "chunked")
+    )
+    
+    whole = {path.name: path.read_text() for path in (tmp_path / "whole").iterdir()}
+    chunked = {path.name: path.read_text() for path in (tmp_path / "chunked").iterdir()}
+    assert whole == chunked
+    assert "2025-03-05 00:23:27.240000" in "".join(whole.values())
+
+
+def test_snapshot_is_reused_while_csv_is_unchanged(csv_file):
+    MTGCardSorter(str(csv_file)).load_cards()
+    sorter = MTGCardSorter(str(csv_file))
+    
+    assert sorter.snapshot_file.exists()
+    assert sorter._snapshot_is_fresh()
+    assert list(sorter.cards_df['Name']) == ["Lightning Bolt", "Swamp", "Hubris"]
+
+
+def test_snapshot_is_not_reused_for_csv_replaced_by_older_copy(csv_file):
+    before = csv_file.stat()
+    MTGCardSorter(str(csv_file)).load_cards()
+    
+    # Like cp -p: new contents, but an mtime older than the snapshot
+    csv_file.write_text(MOXFIELD_CSV.replace("Lightning Bolt", "Shock"))
+    os.utime(csv_file, ns=(before.st_atime_ns, before.st_mtime_ns - 10**9))
+    sorter = MTGCardSorter(str(csv_file))
+    
+    assert not sorter._snapshot_is_fresh()
+    assert "Shock" in list(sorter.cards_df['Name'])
+
+
+def test_blank_foil_cells_count_as_non_foil(csv_file, capsys):
+    MTGCardSorter(str(csv_file)).get_collection_statistics()
+    
+    output = capsys.readouterr().out
+    assert "Foil cards: 1\n" in output
+    assert "Non-foil cards: 2\n" in output
+
+
+def _group_names(groups):
+    return {group: list(cards['Name']) for group, cards in groups.items() if not cards.empty}
+
+
+def test_rarity_tiers_treat_missing_prices_as_common(csv_file):
+    groups = _group_names(MTGCardSorter(str(csv_file)).sort_by_rarity())
+    
+    assert groups == {"Common": ["Swamp", "Hubris"], "Uncommon": ["Lightning Bolt"]}
+
+
+def test_rarity_tiers_parse_dollar_prices(tmp_path):
+    csv_file = tmp_path / "moxfield_export.csv"
+    csv_file.write_text(MOXFIELD_CSV.replace(",1.50\n", ",$12.00\n").replace(",0.25\n", ",$0.25\n"))
+    
+    groups = _group_names(MTGCardSorter(str(csv_file)).sort_by_rarity())
+    
+    assert groups == {"Common": ["Swamp", "Hubris"], "Mythic Rare": ["Lightning Bolt"]}
+
+
+def test_land_names_match_whole_words_only(csv_file):
+    groups = _group_names(MTGCardSorter(str(csv_file)).sort_by_type())
+    
+    # "Hubris" contains "hub" but is not a land
+    assert groups == {"Lands": ["Swamp"], "Other": ["Lightning Bolt", "Hubris"]}
+
+
+def test_search_is_a_case_insensitive_literal_match(csv_file, capsys):
+    sorter = MTGCardSorter(str(csv_file))
+    
+    sorter.search_cards("BOLT")
+    assert "Lightning Bolt" in capsys.readouterr().out
+    
+    # Regex metacharacters are matched literally, not as patterns
+    sorter.search_cards("b.lt")
+    assert "No cards found matching 'b.lt'" in capsys.readouterr().out
+    sorter.search_cards("bolt (")
+    assert "No cards found matching 'bolt ('" in capsys.readouterr().out
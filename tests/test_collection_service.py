@@ -0,0 +1,90 @@
+"""Tests for CollectionService's enriched export."""
+
+import threading
+
+import pytest
+
+from src.data import CSVLoader
+from src.models import Card, Collection
+from src.services import CollectionService
+
+
+class _FakeClient:
+    """Stands in for ScryfallClient; optionally fails after a number of cards."""
+    
+    def __init__(self, fail_after=None, before_next_card=None):
+        self.fail_after = fail_after
+        self.before_next_card = before_next_card  # Called before every card but the first
+        self.enriched = 0
+    
+    def iter_enrich_collection(self, cards, progress_callback=None):
+        for card in cards:
+            if self.enriched == self.fail_after:
+                raise KeyboardInterrupt
+            if self.enriched and self.before_next_card:
+                self.before_next_card()
+            self.enriched += 1
+            yield card, True
+
+
+@pytest.fixture
+def collection():
+    return Collection([Card(name=f"Card {i}", edition="tst") for i in range(5)])
+
+
+def _service(collection, client, loader=None):
+    service = CollectionService(loader or CSVLoader(), client)
+    service.collection = collection
+    return service
+
+
+def test_export_replaces_file_when_complete(tmp_path, collection):
+    output = tmp_path / "enriched.csv"
+    output.write_text("previous export\n")
+    
+    bytes_written = _service(collection, _FakeClient()).export_enriched_collection(str(output))
+    
+    assert bytes_written == output.stat().st_size
+    assert "Card 4" in output.read_text()
+    assert not (tmp_path / "enriched.csv.part").exists()
+
+
+def test_interrupted_export_keeps_previous_file(tmp_path, collection):
+    output = tmp_path / "enriched.csv"
+    output.write_text("previous export\n")
+    
+    with pytest.raises(KeyboardInterrupt):
+        _service(collection, _FakeClient(fail_after=2)).export_enriched_collection(str(output))
+    
+    assert output.read_text() == "previous export\n"
+    assert not (tmp_path / "enriched.csv.part").exists()
+
+
+def test_writer_failure_stops_enrichment(tmp_path, collection):
+    class _FailingLoader(CSVLoader):
+        """Fails on the first row, like save_cards on a file it cannot open."""
+        
+        def __init__(self):
+            super().__init__()
+            self.failed = threading.Event()
+            self.writer = None
+        
+        def save_cards(self, cards, file_path=None, buffer_size=0):
+            self.writer = threading.current_thread()
+            next(iter(cards))
+            self.failed.set()
+            return None
+    loader = _FailingLoader()
+    
+    def wait_for_writer_to_exit():
+        loader.failed.wait()
+        loader.writer.join()
+    client = _FakeClient(before_next_card=wait_for_writer_to_exit)
+    output = tmp_path / "enriched.csv"
+    
+    bytes_written = _service(collection, client, loader).export_enriched_collection(str(output))
+    
+    assert bytes_written is None
+    # The card enriched after the writer exited is the last one
+    assert client.enriched == 2
+    assert not output.exists()
@@ -0,0 +1,29 @@
+"""Tests for the legacy EnhancedMTGCardSorter exports."""
+
+import pytest
+
+from enhanced_sorter import EnhancedMTGCardSorter
+
+
+MOXFIELD_CSV = (
+    "Count,Tradelist Count,Name,Edition,Condition,Language,Foil,Tags,"
+    "Last Modified,Collector Number,Alter,Proxy,Purchase Price\n"
+    "2,0,Lightning Bolt,2xm,Near Mint,English,foil,,2025-03-05 00:23:27.240000,141,False,False,1.50\n"
+)
+
+
+def test_enhanced_export_keeps_pandas_csv_format(tmp_path):
+    csv_file = tmp_path / "moxfield_export.csv"
+    csv_file.write_text(MOXFIELD_CSV)
+    sorter = EnhancedMTGCardSorter(str(csv_file), use_api=False)
+    
+    sorter.export_enhanced_collection("color", str(tmp_path / "out"))
+    
+    header, row = (tmp_path / "out" / "enhanced_color_unknown.csv").read_text().splitlines()
+    assert header.startswith("Count,Tradelist Count,Name,Edition,")
+    # Existing consumers read Foil, Alter, Proxy and Last Modified back unchanged,
+    # and list fields keep their Python repr
+    assert row == (
+        "2,0,Lightning Bolt,2xm,Near Mint,English,foil,,2025-03-05 00:23:27.240000,"
+        "141,False,False,1.5,Lightning Bolt,[],[],,unknown"
+    )
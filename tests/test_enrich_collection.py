@@ -0,0 +1,95 @@
+"""Tests for the enrich script's up-to-date check."""
+
+import importlib.util
+import os
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.models import Card
+from src.services import CollectionService
+
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "enrich_collection.py"
+
+
+@pytest.fixture
+def enrich(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("enrich_collection", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for name, filename in [("SOURCE_FILE", "moxfield_export.csv"), ("OUTPUT_FILE", "enriched.csv"),
+                           ("CACHE_FILE", "card_cache.json"), ("MANIFEST_FILE", "manifest.json")]:
+        path = tmp_path / filename
+        monkeypatch.setattr(module, name, str(path))
+    Path(module.SOURCE_FILE).write_text("Count,Name,Edition\n1,Lightning Bolt,2xm\n")
+    Path(module.CACHE_FILE).write_text("{}")
+    Path(module.OUTPUT_FILE).write_text("Count,Name,Rarity\n1,Lightning Bolt,common\n")
+    return module
+
+
+def test_export_is_fresh_after_manifest_is_written(enrich, monkeypatch):
+    assert not enrich._export_is_fresh()
+    enrich._write_manifest()
+    assert enrich._export_is_fresh()
+    
+    # An up-to-date export returns before asking to enrich
+    monkeypatch.setattr("builtins.input", lambda prompt: pytest.fail("asked to enrich"))
+    assert enrich.main([]) == 0
+
+
+def test_force_enriches_an_up_to_date_export(enrich, monkeypatch):
+    enrich._write_manifest()
+    prompts = []
+    monkeypatch.setattr("builtins.input", lambda prompt: prompts.append(prompt) or "n")
+    
+    assert enrich.main(["--force"]) == 0
+    assert prompts
+
+
+@pytest.mark.parametrize("enriched, manifest_kept", [(1, True), (0, False)])
+def test_manifest_is_only_written_when_every_card_was_enriched(enrich, monkeypatch,
+                                                               enriched, manifest_kept):
+    Path(enrich.MANIFEST_FILE).write_text("{}")
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+    monkeypatch.setattr(CollectionService, "enrich_and_export",
+                        lambda self, file_path: (enriched, Path(file_path).stat().st_size))
+    
+    assert enrich.main([]) == 0
+    assert Path(enrich.MANIFEST_FILE).exists() == manifest_kept
+    assert enrich._export_is_fresh() == manifest_kept
+
+
+@pytest.mark.parametrize("changed", ["SOURCE_FILE", "CACHE_FILE", "OUTPUT_FILE"])
+def test_changed_file_makes_export_stale(enrich, changed):
+    enrich._write_manifest()
+    path = Path(getattr(enrich, changed))
+    stat = path.stat()
+    
+    # Same mtime, different size: compared for equality, not by age
+    path.write_text(path.read_text() + "\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    
+    assert not enrich._export_is_fresh()
+
+
+@pytest.mark.parametrize("missing", ["SOURCE_FILE", "OUTPUT_FILE"])
+def test_missing_file_makes_export_stale(enrich, missing):
+    enrich._write_manifest()
+    os.remove(getattr(enrich, missing))
+    
+    assert not enrich._export_is_fresh()
+
+
+def test_collection_totals_follow_card_total_value(enrich):
+    cards = [
+        Card(name="Lightning Bolt", edition="2xm", count=2, purchase_price=Decimal("1.50"),
+             market_value=Decimal("3.00")),
+        Card(name="Swamp", edition="dmu", count=3, market_value=Decimal("0.10")),
+        Card(name="Hubris", edition="jou"),
+    ]
+    
+    assert enrich._collection_totals(cards) == (
+        6, Decimal("3.00"), sum((card.total_value for card in cards), Decimal("0"))
+    )
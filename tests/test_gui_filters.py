@@ -0,0 +1,97 @@
+"""Tests for the card table's filter columns (no display needed)."""
+
+import itertools
+
+import pytest
+
+from gui import CardTableWidget
+from src.models import Card, CardRarity
+
+
+class _FakeTree:
+    """The few Treeview calls populate_data and show_rows make."""
+    
+    def __init__(self):
+        self.children = []
+    
+    def grid(self):
+        pass
+    
+    def grid_remove(self):
+        pass
+    
+    def delete(self, *items):
+        self.children = [child for child in self.children if child not in items]
+    
+    def insert(self, parent, index, iid, values):
+        self.children.append(iid)
+    
+    def set_children(self, parent, *items):
+        self.children = list(items)
+
+
+CARDS = [
+    Card(name="Lightning Bolt", edition="2xm", rarity=CardRarity.UNCOMMON,
+         set_name="Double Masters", type_line="Instant"),
+    Card(name="Swamp", edition="dmu", foil=True, rarity=CardRarity.COMMON,
+         set_name="Dominaria United", type_line="Basic Land — Swamp"),
+    Card(name="Sheoldred, the Apocalypse", edition="dmu", foil=True, rarity=CardRarity.MYTHIC,
+         set_name="Dominaria United", type_line="Legendary Creature — Phyrexian Praetor"),
+    Card(name="Unknown Proxy", edition="prx"),
+]
+
+
+def _old_filter(cards, rarity, set_filter, foil_only, search_term):
+    """The filters apply_filters ran over Card attributes before the filter columns."""
+    rows = range(len(cards))
+    if rarity:
+        rows = [i for i in rows if cards[i].rarity and cards[i].rarity.value.lower() == rarity.lower()]
+    if set_filter:
+        rows = [i for i in rows
+                if (cards[i].set_name and set_filter in cards[i].set_name)
+                or (cards[i].edition and set_filter in cards[i].edition)]
+    if foil_only:
+        rows = [i for i in rows if cards[i].foil]
+    if search_term:
+        term = search_term.lower()
+        rows = [i for i in rows
+                if term in cards[i].name.lower() or term in cards[i].edition.lower()
+                or term in (cards[i].type_line or "").lower()]
+    return list(rows)
+
+
+@pytest.fixture
+def table():
+    table = CardTableWidget.__new__(CardTableWidget)
+    table.tree = _FakeTree()
+    table._iids = []
+    table.populate_data(CARDS)
+    return table
+
+
+@pytest.mark.parametrize("rarity, set_filter, foil_only, search_term", list(itertools.product(
+    ["", "Common", "MYTHIC", "rare"],
+    ["", "Dominaria", "2xm", "prx"],
+    [False, True],
+    ["", "swamp", "DMU", "creature"],
+)))
+def test_filter_rows_matches_attribute_filters(table, rarity, set_filter, foil_only, search_term):
+    expected = _old_filter(CARDS, rarity, set_filter, foil_only, search_term)
+    assert table.filter_rows(rarity, set_filter, foil_only, search_term) == expected
+
+
+def test_filter_columns_are_rebuilt_on_populate(table):
+    table.populate_data(CARDS[:1])
+    
+    assert table.filter_rows(foil_only=True) == []
+    assert table.filter_rows(rarity="Uncommon") == [0]
+    assert table.set_names == ["Double Masters"]
+
+
+def test_show_rows_displays_only_the_filtered_cards(table):
+    table.show_rows(table.filter_rows(set_filter="Dominaria", foil_only=True))
+    
+    assert table.tree.children == ["1", "2"]
+    assert [table.cards[int(iid)].name for iid in table.tree.children] == [
+        "Swamp", "Sheoldred, the Apocalypse"
+    ]
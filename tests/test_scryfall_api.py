@@ -0,0 +1,58 @@
+"""Tests for the legacy ScryfallAPI cache expiry."""
+
+import json
+import time
+
+import pytest
+import requests
+
+import scryfall_api
+from scryfall_api import ScryfallAPI
+from src.data.scryfall_client import ScryfallClient
+
+
+BOLT = {"name": "Lightning Bolt", "set": "2xm", "rarity": "uncommon"}
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setattr(scryfall_api.time, "sleep", lambda seconds: None)
+    return ScryfallAPI(str(tmp_path / "card_cache.json"))
+
+
+def _offline(*args, **kwargs):
+    raise requests.ConnectionError("offline")
+
+
+def test_fetch_times_are_kept_out_of_the_shared_cache(api, monkeypatch):
+    api._store("Lightning Bolt_2xm", BOLT)
+    api._save_cache()
+
+    cache = json.loads(api.cache_file.read_text())
+    assert list(cache) == ["Lightning Bolt_2xm"]
+    assert "Lightning Bolt_2xm" in json.loads(api.timestamps_file.read_text())
+    assert ScryfallAPI(str(api.cache_file)).cached_at.keys() == {"Lightning Bolt_2xm"}
+    # The client reading the same file must not index anything under an empty name
+    assert "" not in ScryfallClient(str(api.cache_file))._name_index
+
+
+def test_expired_entry_is_returned_when_refresh_fails(api, monkeypatch):
+    api._store("Lightning Bolt_2xm", BOLT)
+    api.cached_at["Lightning Bolt_2xm"] = time.time() - ScryfallAPI.CACHE_TTL - 1
+    monkeypatch.setattr(scryfall_api.requests, "get", _offline)
+    monkeypatch.setattr(scryfall_api.requests, "post", _offline)
+
+    assert api.get_card_data("Lightning Bolt", "2xm") == BOLT
+    assert api.get_cards_data([("Lightning Bolt", "2xm")]) == {"Lightning Bolt_2xm": BOLT}
+
+
+def test_batch_requests_use_a_timeout(api, monkeypatch):
+    seen = {}
+
+    def post(url, json, timeout=None):
+        seen["timeout"] = timeout
+        raise requests.Timeout("stalled")
+    monkeypatch.setattr(scryfall_api.requests, "post", post)
+
+    assert api.get_cards_data([("Lightning Bolt", "2xm")]) == {}
+    assert seen["timeout"] == ScryfallAPI.REQUEST_TIMEOUT
@@ -0,0 +1,58 @@
+"""Tests for ScryfallClient's cache lookups."""
+
+import json
+from decimal import Decimal
+
+import pytest
+import requests
+
+from src.data.scryfall_client import ScryfallClient
+from src.models import Card, CardRarity
+
+
+OTHER_PRINTING = {
+    "id": "other-printing-id",
+    "name": "Lightning Bolt",
+    "colors": ["R"],
+    "type_line": "Instant",
+    "mana_cost": "{R}",
+    "cmc": 1.0,
+    "oracle_text": "Lightning Bolt deals 3 damage to any target.",
+    "rarity": "common",
+    "prices": {"usd": "1.50"},
+}
+
+
+@pytest.fixture
+def client(tmp_path):
+    cache_file = tmp_path / "card_cache.json"
+    cache_file.write_text(json.dumps({"lightning bolt|m10": OTHER_PRINTING}))
+    return ScryfallClient(str(cache_file))
+
+
+def test_network_failure_leaves_card_unenriched(client, monkeypatch):
+    def offline(*args, **kwargs):
+        raise requests.ConnectionError("offline")
+    monkeypatch.setattr(client.session, "get", offline)
+    card = Card(name="Lightning Bolt", edition="2xm", market_value=Decimal("2.00"))
+
+    assert not client.enrich_card(card)
+
+    # Nothing is copied from the other cached printing
+    assert card.oracle_text is None
+    assert card.scryfall_id is None
+    assert card.market_value == Decimal("2.00")
+
+
+def test_exact_printing_applies_cached_data(client):
+    card = Card(name="Lightning Bolt", edition="M10")
+
+    assert client.enrich_card(card)
+    assert card.scryfall_id == "other-printing-id"
+    assert card.rarity == CardRarity.COMMON
+    assert card.market_value == Decimal("1.50")
+
+
+def test_name_index_finds_any_cached_printing(client):
+    assert client._find_any_printing("LIGHTNING BOLT") == OTHER_PRINTING
+    assert client._find_any_printing("Shock") is None